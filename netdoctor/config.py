@@ -7,9 +7,13 @@ DEFAULT_PING_TIMEOUT = 1.0
 DEFAULT_PORT_SCAN_TIMEOUT = 3.0
 DEFAULT_DNS_TIMEOUT = 5.0
 
+# Cache lifetimes (seconds)
+WHOIS_CACHE_TTL = 3600  # 0 disables the WHOIS cache
+
 # Default concurrency settings
 DEFAULT_PORT_SCAN_THREADS = 50
 DEFAULT_PING_SWEEP_THREADS = 10
+DEFAULT_WHOIS_THREADS = 8
 
 # UI defaults
 DEFAULT_THEME = "dark"
@@ -18,7 +22,9 @@ DEFAULT_REFRESH_RATE = 1000  # milliseconds
 # Storage settings
 STORAGE_TYPE = "sqlite"  # "sqlite" or "json"
 DB_FILENAME = "netdoctor_history.db"
-JSON_HISTORY_FILENAME = "history.json"
+JSON_HISTORY_FILENAME = "history.jsonl"
+JSON_HISTORY_INDEX_FILENAME = "history.idx"
+LEGACY_JSON_HISTORY_FILENAME = "history.json"  # Pre-JSONL format, migrated on first use
 
 # Settings defaults
 NMAP_PATH = ""
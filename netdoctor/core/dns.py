@@ -4,14 +4,21 @@ DNS wrapper module.
 DNS queries using dnspython for record lookups.
 """
 
-import dns.resolver
-import dns.exception
-from typing import Dict, List, Any, Optional
+import copy
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+# Results are cached per domain until their shortest record TTL runs out;
+# lookups whose records carry no TTL (or that found nothing) are kept this long
+_DEFAULT_TTL = 60.0
+_CACHE: Dict[str, Tuple[float, Dict[str, List[Dict[str, Any]]]]] = {}
+_CACHE_LOCK = threading.Lock()
 
 
 def query_records(domain: str) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Query DNS records for a domain.
+    Query DNS records for a domain, reusing a cached result until it expires.
 
     Args:
         domain: Domain name to query (e.g., "example.com")
@@ -21,6 +28,34 @@ def query_records(domain: str) -> Dict[str, List[Dict[str, Any]]]:
         Each record dict contains: type, name, value, ttl (if available)
         Keys: 'A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME'
     """
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        cached = _CACHE.get(domain)
+    # Callers get their own copy, so changing a result can't alter the cache
+    if cached is not None and now < cached[0]:
+        return copy.deepcopy(cached[1])
+
+    results = _query_records_uncached(domain)
+    ttls = [record["ttl"] for records in results.values() for record in records
+            if record.get("ttl") is not None]
+    expires = now + (min(ttls) if ttls else _DEFAULT_TTL)
+    with _CACHE_LOCK:
+        _CACHE[domain] = (expires, results)
+    return copy.deepcopy(results)
+
+
+def clear_cache():
+    """Forget all cached DNS results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _query_records_uncached(domain: str) -> Dict[str, List[Dict[str, Any]]]:
+    # dnspython takes tens of milliseconds to import, so it is only loaded
+    # once a lookup is actually made
+    import dns.resolver
+    import dns.exception
+
     results = {
         "A": [],
         "AAAA": [],
@@ -10,12 +10,57 @@ import time
 import subprocess
 import platform
 import re
-from typing import List, Dict, Any, Optional, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
+from typing import List, Dict, Any, Optional, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 import ipaddress
 
 from netdoctor.config import DEFAULT_PING_TIMEOUT, DEFAULT_PING_SWEEP_THREADS
 
+# Ping output patterns, compiled once at import and matched over the whole
+# output with finditer, so the output is never split into lines. They match
+# the raw bytes from the ping command, so the output is never decoded either.
+# "." does not match newlines, so each match stays within one line.
+# Linux/macOS replies and timeouts:
+#   64 bytes from 127.0.0.1: icmp_seq=1 ttl=64 time=0.023 ms
+#   Request timeout for icmp_seq=2
+_UNIX_LINE_RE = re.compile(
+    rb"icmp_seq=(?P<seq>\d+).*ttl=(?P<ttl>\d+).*time=(?P<rtt>[\d.]+)[ \t]*ms"
+    rb"|Request timeout for icmp_seq=(?P<tseq>\d+)"
+)
+# Windows replies and timeouts, one per line:
+#   Reply from 127.0.0.1: bytes=32 time<1ms TTL=128 (or time=5ms)
+#   Request timed out.
+_WINDOWS_LINE_RE = re.compile(
+    rb"^(?:(?P<timeout>.*timed out.*)"
+    rb"|.*reply from.*time(?P<op>[<=])(?P<rtt>[\d.]+)ms.*ttl=(?P<ttl>\d+).*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Whole-millisecond RTTs (as Windows always reports them) are looked up here
+# instead of going through float(), which is about twice as slow
+_MS_TABLE = {str(i).encode(): float(i) for i in range(1000)}
+
+# fping -C summary lines (written to stderr), one per target:
+#   192.168.1.1 : 0.52
+#   192.168.1.2 : -
+_FPING_LINE_RE = re.compile(rb"^(?P<host>\S+)\s+:\s+(?P<rtt>[\d.]+|-)", re.MULTILINE)
+
+# fping pings a whole list of hosts from one process, so sweeps use it when available
+_FPING = shutil.which("fping")
+
+# Hosts per fping run. A sweep yields results a chunk at a time, so this bounds
+# how long a large network goes without results and how long a cancel waits
+_FPING_CHUNK = 128
+# Minimum gap fping leaves between probes (-i), in milliseconds
+_FPING_INTERVAL_MS = 10
+
+
+def _parse_ms(value: bytes) -> float:
+    """Convert an RTT captured from ping output to a float."""
+    rtt = _MS_TABLE.get(value)
+    return rtt if rtt is not None else float(value)
+
 
 def _create_icmp_socket(ipv6: bool = False) -> Optional[socket.socket]:
     """
@@ -146,38 +191,26 @@ def _ping_raw_socket(host: str, count: int = 4, timeout: float = 2.0, ipv6: bool
     return results
 
 
-def _parse_ping_output_linux(output: str, host: str) -> List[Dict[str, Any]]:
-    """Parse Linux ping output."""
+def _parse_ping_output_unix(output: Union[bytes, str]) -> List[Dict[str, Any]]:
+    """Parse Linux/macOS ping output in a single pass over the buffer."""
+    if isinstance(output, str):
+        output = output.encode()
     results = []
-    lines = output.split("\n")
-
-    # Pattern: 64 bytes from 127.0.0.1: icmp_seq=1 ttl=64 time=0.023 ms
-    pattern = r"icmp_seq=(\d+).*ttl=(\d+).*time=([\d.]+)\s*ms"
-    for line in lines:
-        match = re.search(pattern, line)
-        if match:
-            seq = int(match.group(1))
-            ttl = int(match.group(2))
-            rtt = float(match.group(3))
+    for match in _UNIX_LINE_RE.finditer(output):
+        if match.group("seq") is not None:
             results.append(
                 {
-                    "seq": seq,
-                    "rtt_ms": round(rtt, 2),
-                    "ttl": ttl,
+                    "seq": int(match.group("seq")),
+                    "rtt_ms": round(_parse_ms(match.group("rtt")), 2),
+                    "ttl": int(match.group("ttl")),
                     "success": True,
                     "error": None,
                 }
             )
-
-    # Pattern for timeouts: Request timeout for icmp_seq X
-    timeout_pattern = r"Request timeout for icmp_seq=(\d+)"
-    for line in lines:
-        match = re.search(timeout_pattern, line)
-        if match:
-            seq = int(match.group(1))
+        else:
             results.append(
                 {
-                    "seq": seq,
+                    "seq": int(match.group("tseq")),
                     "rtt_ms": None,
                     "ttl": None,
                     "success": False,
@@ -188,35 +221,28 @@ def _parse_ping_output_linux(output: str, host: str) -> List[Dict[str, Any]]:
     return sorted(results, key=lambda x: x["seq"])
 
 
-def _parse_ping_output_macos(output: str, host: str) -> List[Dict[str, Any]]:
+def _parse_ping_output_linux(output: Union[bytes, str], host: str) -> List[Dict[str, Any]]:
+    """Parse Linux ping output."""
+    return _parse_ping_output_unix(output)
+
+
+def _parse_ping_output_macos(output: Union[bytes, str], host: str) -> List[Dict[str, Any]]:
     """Parse macOS ping output."""
+    return _parse_ping_output_unix(output)
+
+
+def _parse_ping_output_windows(output: Union[bytes, str], host: str) -> List[Dict[str, Any]]:
+    """Parse Windows ping output in a single pass over the buffer."""
+    if isinstance(output, str):
+        output = output.encode()
     results = []
-    lines = output.split("\n")
-
-    # Pattern: 64 bytes from 127.0.0.1: icmp_seq=1 ttl=64 time=0.023 ms
-    pattern = r"icmp_seq=(\d+).*ttl=(\d+).*time=([\d.]+)\s*ms"
-    for line in lines:
-        match = re.search(pattern, line)
-        if match:
-            seq = int(match.group(1))
-            ttl = int(match.group(2))
-            rtt = float(match.group(3))
-            results.append(
-                {
-                    "seq": seq,
-                    "rtt_ms": round(rtt, 2),
-                    "ttl": ttl,
-                    "success": True,
-                    "error": None,
-                }
-            )
+    seq = 0
 
-    # Pattern for timeouts
-    timeout_pattern = r"Request timeout for icmp_seq=(\d+)"
-    for line in lines:
-        match = re.search(timeout_pattern, line)
-        if match:
-            seq = int(match.group(1))
+    # Windows output has no sequence numbers, so replies and timeouts are
+    # numbered in the order they appear
+    for match in _WINDOWS_LINE_RE.finditer(output):
+        seq += 1
+        if match.group("timeout") is not None:
             results.append(
                 {
                     "seq": seq,
@@ -226,57 +252,24 @@ def _parse_ping_output_macos(output: str, host: str) -> List[Dict[str, Any]]:
                     "error": "Request timed out",
                 }
             )
-
-    return sorted(results, key=lambda x: x["seq"])
-
-
-def _parse_ping_output_windows(output: str, host: str) -> List[Dict[str, Any]]:
-    """Parse Windows ping output."""
-    results = []
-    lines = output.split("\n")
-    seq = 0
-
-    for line in lines:
-        line_lower = line.lower()
-        # Check for timeout first
-        if "request timed out" in line_lower or "timed out" in line_lower:
-            seq += 1
+        else:
+            time_str = match.group("rtt")
+            # Handle <1ms case
+            if match.group("op") == b"<" and time_str == b"1":
+                rtt = 0.1
+            else:
+                rtt = _parse_ms(time_str)
             results.append(
                 {
                     "seq": seq,
-                    "rtt_ms": None,
-                    "ttl": None,
-                    "success": False,
-                    "error": "Request timed out",
+                    "rtt_ms": round(rtt, 2),
+                    "ttl": int(match.group("ttl")),
+                    "success": True,
+                    "error": None,
                 }
             )
-        # Pattern: Reply from 127.0.0.1: bytes=32 time<1ms TTL=128
-        # Pattern: Reply from 127.0.0.1: bytes=32 time=5ms TTL=128
-        elif "reply from" in line_lower:
-            # Match time<1ms or time=5ms
-            time_match = re.search(r"time[<=](\d+)ms", line, re.IGNORECASE)
-            ttl_match = re.search(r"ttl=(\d+)", line, re.IGNORECASE)
-            
-            if time_match and ttl_match:
-                seq += 1
-                time_str = time_match.group(1)
-                # Handle <1ms case
-                if "<" in line and time_str == "1":
-                    rtt = 0.1
-                else:
-                    rtt = float(time_str)
-                ttl = int(ttl_match.group(1))
-                results.append(
-                    {
-                        "seq": seq,
-                        "rtt_ms": round(rtt, 2),
-                        "ttl": ttl,
-                        "success": True,
-                        "error": None,
-                    }
-                )
 
-    return sorted(results, key=lambda x: x["seq"])
+    return results
 
 
 def _ping_subprocess(host: str, count: int = 4, timeout: float = 2.0, ipv6: bool = False) -> List[Dict[str, Any]]:
@@ -310,7 +303,7 @@ def _ping_subprocess(host: str, count: int = 4, timeout: float = 2.0, ipv6: bool
 
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=(count * timeout + 5), check=False
+            cmd, capture_output=True, timeout=(count * timeout + 5), check=False
         )
         output = result.stdout + result.stderr
 
@@ -374,9 +367,13 @@ def ping_sweep(
     """
     Ping multiple hosts in a network range in parallel.
 
+    IPv4 networks go through fping when it is installed, _FPING_CHUNK hosts per
+    run, with each run's results yielded as soon as it exits. Otherwise, or for
+    a chunk fping fails on, hosts are pinged individually on a thread pool.
+
     Args:
         network_cidr: Network in CIDR notation (e.g., "192.168.1.0/24")
-        concurrency: Maximum number of concurrent pings (default: 10)
+        concurrency: Maximum number of concurrent per-host pings (default: 10)
 
     Yields:
         Dictionaries with keys: host, results (list of ping results)
@@ -387,6 +384,24 @@ def ping_sweep(
         yield {"host": network_cidr, "results": [], "error": f"Invalid network: {str(e)}"}
         return
 
+    if _FPING and network.version == 4:
+        hosts = (str(host) for host in network.hosts())
+        while True:
+            chunk = list(islice(hosts, _FPING_CHUNK))
+            if not chunk:
+                return
+            results = _ping_sweep_fping(chunk, timeout=1.0)
+            if results is None:
+                # fping could not be run, ping this chunk host by host instead
+                results = _ping_sweep_threads(iter(chunk), concurrency)
+            yield from results
+
+    yield from _ping_sweep_threads(network.hosts(), concurrency)
+
+
+def _ping_sweep_threads(hosts: Iterator[Any], concurrency: int) -> Iterator[Dict[str, Any]]:
+    """Ping hosts once each on a thread pool, yielding results as they complete."""
+
     def ping_single_host(host: str) -> Dict[str, Any]:
         """Ping a single host and return result."""
         try:
@@ -395,15 +410,96 @@ def ping_sweep(
         except Exception as e:
             return {"host": str(host), "results": [], "error": str(e)}
 
+    # Hosts are submitted a couple per worker at a time rather than all up
+    # front, so a large network (a /16 is 65k hosts) starts yielding at once
+    # and closing the generator only waits for the pings in flight
+    remaining = hosts
+    future_to_host = {}
+
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all ping tasks
-        future_to_host = {executor.submit(ping_single_host, host): host for host in network.hosts()}
+        def submit_next():
+            host = next(remaining, None)
+            if host is not None:
+                future_to_host[executor.submit(ping_single_host, host)] = host
+
+        for _ in range(concurrency * 2):
+            submit_next()
 
         # Yield results as they complete
-        for future in as_completed(future_to_host):
-            try:
-                result = future.result()
-                yield result
-            except Exception as e:
-                host = future_to_host[future]
-                yield {"host": str(host), "results": [], "error": str(e)}
+        while future_to_host:
+            done, _ = wait(future_to_host, return_when=FIRST_COMPLETED)
+            for future in done:
+                host = future_to_host.pop(future)
+                submit_next()
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield {"host": str(host), "results": [], "error": str(e)}
+
+
+def _ping_sweep_fping(hosts: List[str], timeout: float = 1.0) -> Optional[List[Dict[str, Any]]]:
+    """
+    Ping every host once with a single fping process.
+
+    ping_sweep calls this for one chunk of _FPING_CHUNK hosts at a time.
+
+    Args:
+        hosts: IPv4 addresses to ping
+        timeout: Timeout per ping in seconds
+
+    Returns:
+        ping_sweep result dictionaries in host order, or None if fping could not
+        be run (so the caller falls back to per-host pings)
+    """
+    # Targets are passed on stdin, so large networks don't hit argument limits
+    cmd = [
+        _FPING, "-C", "1", "-q",
+        "-t", str(int(timeout * 1000)),
+        "-i", str(_FPING_INTERVAL_MS),
+    ]
+    # fping sends the probes _FPING_INTERVAL_MS apart, then waits out the timeout
+    deadline = len(hosts) * _FPING_INTERVAL_MS / 1000 + timeout + 5
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except OSError:
+        return None
+    try:
+        _, stderr = proc.communicate("\n".join(hosts).encode(), timeout=deadline)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    finally:
+        # Never leave fping running, whether it timed out or the sweep stopped
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    rtts = {match.group("host").decode(): match.group("rtt") for match in _FPING_LINE_RE.finditer(stderr)}
+    if not rtts:
+        return None
+
+    results = []
+    for host in hosts:
+        rtt = rtts.get(host, b"-")
+        if rtt == b"-":
+            ping_result = {
+                "seq": 1,
+                "rtt_ms": None,
+                "ttl": None,
+                "success": False,
+                "error": "Request timed out",
+            }
+        else:
+            ping_result = {
+                "seq": 1,
+                "rtt_ms": round(_parse_ms(rtt), 2),
+                "ttl": None,  # fping does not report TTLs
+                "success": True,
+                "error": None,
+            }
+        results.append({"host": host, "results": [ping_result], "error": None})
+    return results
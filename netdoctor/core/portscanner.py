@@ -4,14 +4,24 @@ Port scanning logic module.
 TCP connect scanning across ranges with configurable concurrency.
 """
 
+import errno
+import os
+import selectors
 import socket
 import subprocess
 import shutil
-from typing import List, Dict, Any, Union, Optional, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from typing import List, Dict, Any, Union, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import compress
 
 from netdoctor.config import DEFAULT_PORT_SCAN_TIMEOUT, DEFAULT_PORT_SCAN_THREADS
 
+# Number of valid TCP ports (0-65535)
+_PORT_COUNT = 65536
+
 
 def _parse_port_range(ports: Union[str, int, List[int]]) -> List[int]:
     """
@@ -24,34 +34,104 @@ def _parse_port_range(ports: Union[str, int, List[int]]) -> List[int]:
             - str: Comma-separated ports or ranges (e.g., "80,443,8000-8010")
 
     Returns:
-        List of port numbers
+        List of port numbers; for strings, sorted, deduplicated and limited
+        to valid ports
     """
     if isinstance(ports, int):
         return [ports]
     if isinstance(ports, list):
         return ports
 
-    # Parse string format
-    port_list = []
+    # Scans of many hosts reuse the same spec, so string parses are cached
+    return list(_parse_port_spec(ports))
+
+
+@lru_cache(maxsize=256)
+def _parse_port_spec(ports: str) -> Tuple[int, ...]:
+    """Parse a port spec string (see _parse_port_range) into sorted unique ports."""
+    # Parse string format into a bitmap of valid ports (0-65535), so ranges
+    # are marked with one slice assignment and duplicates collapse for free
+    seen = bytearray(_PORT_COUNT)
     for part in ports.split(","):
         part = part.strip()
         if "-" in part:
             # Range: 8000-8010
             start, end = part.split("-", 1)
             try:
-                start_port = int(start.strip())
-                end_port = int(end.strip())
-                port_list.extend(range(start_port, end_port + 1))
+                start_port = max(int(start.strip()), 0)
+                end_port = min(int(end.strip()), _PORT_COUNT - 1)
             except ValueError:
                 continue
+            if start_port <= end_port:
+                seen[start_port:end_port + 1] = b"\x01" * (end_port - start_port + 1)
         else:
             # Single port
             try:
-                port_list.append(int(part))
+                port = int(part)
             except ValueError:
                 continue
+            if 0 <= port < _PORT_COUNT:
+                seen[port] = 1
+
+    # Unpack the bitmap in order, which also sorts the ports
+    return tuple(compress(range(_PORT_COUNT), seen))
+
+
+# Hostname -> (resolved at, addresses). A scan connects to the same host once
+# per port, so it is resolved once and the addresses reused for a short while
+_RESOLVE_TTL = 60.0
+_resolve_cache: Dict[str, Tuple[float, List[Tuple[int, str]]]] = {}
+_resolve_lock = threading.Lock()
+
+
+def _resolve(host: str) -> List[Tuple[int, str]]:
+    """
+    Resolve a hostname, caching the result for _RESOLVE_TTL seconds.
+
+    Returns:
+        (family, address) pairs in getaddrinfo order, without duplicates
+
+    Raises:
+        socket.gaierror: If the host cannot be resolved
+    """
+    now = time.monotonic()
+    with _resolve_lock:
+        cached = _resolve_cache.get(host)
+    if cached is not None and now - cached[0] < _RESOLVE_TTL:
+        return cached[1]
+
+    addresses = []
+    for family, _, _, _, sockaddr in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM):
+        if (family, sockaddr[0]) not in addresses:
+            addresses.append((family, sockaddr[0]))
+    with _resolve_lock:
+        _resolve_cache[host] = (now, addresses)
+    return addresses
 
-    return sorted(set(port_list))  # Remove duplicates and sort
+
+def clear_cache():
+    """Forget all cached hostname resolutions."""
+    with _resolve_lock:
+        _resolve_cache.clear()
+
+
+def _connect(host: str, port: int, timeout: float) -> socket.socket:
+    """
+    Connect to a port on host, trying each resolved address in turn.
+
+    Like socket.create_connection, a dual-stack host whose first address is
+    unreachable still gets connected through the others.
+
+    Raises:
+        OSError: The error from the last address tried
+    """
+    error: Optional[OSError] = None
+    for _, address in _resolve(host):
+        try:
+            return socket.create_connection((address, port), timeout=timeout)
+        except OSError as e:
+            error = e
+    raise error
 
 
 def _grab_banner(sock: socket.socket, timeout: float = 2.0) -> Optional[str]:
@@ -70,19 +150,27 @@ def _grab_banner(sock: socket.socket, timeout: float = 2.0) -> Optional[str]:
         # Try to read initial response (common for services like HTTP, FTP, SSH)
         banner = sock.recv(1024)
         if banner:
-            # Decode and clean up banner
+            # Decode and clean up banner. Most banners (HTTP, SSH, FTP, SMTP)
+            # are plain ASCII, which skips the UTF-8 decoder entirely
             try:
-                banner_str = banner.decode("utf-8", errors="ignore").strip()
-                # Remove newlines and limit length
-                banner_str = " ".join(banner_str.split()[:10])  # First 10 words
-                return banner_str[:200] if len(banner_str) > 200 else banner_str
-            except Exception:
-                return banner[:100].hex()  # Return hex if can't decode
+                if banner.isascii():
+                    banner_str = banner.decode("ascii")
+                else:
+                    banner_str = banner.decode("utf-8")
+            except UnicodeDecodeError:
+                return banner[:100].hex()  # Return hex for binary data
+            # Remove newlines and limit length
+            banner_str = " ".join(banner_str.split()[:10])  # First 10 words
+            return banner_str[:200] if len(banner_str) > 200 else banner_str
     except (socket.timeout, socket.error, OSError):
         pass
     return None
 
 
+# Every scan result has the same keys; copying this is cheaper than a literal
+_RESULT_TEMPLATE: Dict[str, Any] = {"port": 0, "state": "closed", "banner": None, "error": None}
+
+
 def _scan_single_port(
     host: str, port: int, timeout: float = 1.0, banner_grab: bool = False
 ) -> Dict[str, Any]:
@@ -96,13 +184,14 @@ def _scan_single_port(
         banner_grab: If True, attempt to grab banner after connection
 
     Returns:
-        Dictionary with keys: port, state, banner
+        Dictionary with keys: port, state, banner, error
     """
-    result = {"port": port, "state": "closed", "banner": None}
+    result = _RESULT_TEMPLATE.copy()
+    result["port"] = port
 
     try:
         # Attempt TCP connection
-        sock = socket.create_connection((host, port), timeout=timeout)
+        sock = _connect(host, port, timeout)
         result["state"] = "open"
 
         # Optionally grab banner
@@ -127,36 +216,174 @@ def _scan_single_port(
     return result
 
 
+# connect_ex() codes meaning a non-blocking connect is still in progress
+_CONNECT_PENDING = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+}
+
+
+def _connect_result(port: int, err: int) -> Dict[str, Any]:
+    """Build a scan result from a connect() error code (0 means open)."""
+    result = _RESULT_TEMPLATE.copy()
+    result["port"] = port
+    if err == 0:
+        result["state"] = "open"
+    elif err == errno.ECONNREFUSED:
+        result["error"] = "Connection refused"
+    else:
+        result["error"] = os.strerror(err)
+    return result
+
+
+def _scan_ports_nonblocking(
+    host: str, port_list: List[int], timeout: float, concurrency: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Connect-scan ports from a single thread using non-blocking sockets.
+
+    Up to concurrency connects are in flight at once and a selector reports
+    which have finished, so no worker thread is needed per port. Banners are
+    not grabbed.
+    """
+    try:
+        addresses = _resolve(host)
+    except OSError as e:
+        for port in port_list:
+            result = _RESULT_TEMPLATE.copy()
+            result["port"] = port
+            result["error"] = str(e)
+            yield result
+        return
+
+    # Each port gets a single attempt, so use one address for the whole scan,
+    # preferring IPv4 since dual-stack hosts are more often unreachable over IPv6
+    family, address = next(
+        (entry for entry in addresses if entry[0] == socket.AF_INET), addresses[0]
+    )
+    remaining = iter(port_list)
+    # socket -> (port, deadline)
+    in_flight: Dict[socket.socket, Tuple[int, float]] = {}
+    selector = selectors.DefaultSelector()
+
+    try:
+        while True:
+            # Top up the connects in flight
+            while len(in_flight) < concurrency:
+                port = next(remaining, None)
+                if port is None:
+                    break
+                sock = None
+                try:
+                    sock = socket.socket(family, socket.SOCK_STREAM)
+                    sock.setblocking(False)
+                    err = sock.connect_ex((address, port))
+                except (OSError, OverflowError, TypeError) as e:
+                    # e.g. a port outside 0-65535, or out of file descriptors
+                    if sock is not None:
+                        sock.close()
+                    result = _RESULT_TEMPLATE.copy()
+                    result["port"] = port
+                    result["error"] = str(e)
+                    yield result
+                    continue
+                if err in _CONNECT_PENDING:
+                    selector.register(sock, selectors.EVENT_WRITE)
+                    in_flight[sock] = (port, time.monotonic() + timeout)
+                else:
+                    sock.close()
+                    yield _connect_result(port, err)
+
+            if not in_flight:
+                break
+
+            next_deadline = min(deadline for _, deadline in in_flight.values())
+            for key, _ in selector.select(max(next_deadline - time.monotonic(), 0)):
+                sock = key.fileobj
+                port, _ = in_flight.pop(sock)
+                selector.unregister(sock)
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                sock.close()
+                yield _connect_result(port, err)
+
+            now = time.monotonic()
+            for sock, (port, deadline) in list(in_flight.items()):
+                if deadline <= now:
+                    del in_flight[sock]
+                    selector.unregister(sock)
+                    sock.close()
+                    result = _RESULT_TEMPLATE.copy()
+                    result["port"] = port
+                    result["error"] = "Connection timeout"
+                    yield result
+    finally:
+        # Reached early when the caller stops iterating (e.g. on cancel)
+        for sock in in_flight:
+            selector.unregister(sock)
+            sock.close()
+        selector.close()
+
+
 def scan_ports_iter(
     host: str,
     ports: Union[str, int, List[int]],
     timeout: float = 1.0,
     concurrency: int = DEFAULT_PORT_SCAN_THREADS,
     banner_grab: bool = False,
+    nonblocking: bool = False,
 ) -> Iterator[Dict[str, Any]]:
     """
     Scan multiple ports on a host and yield results as they complete.
+
+    With nonblocking=True (and no banner grab) the ports are connect-scanned
+    from this thread with non-blocking sockets instead of a worker pool.
     """
     port_list = _parse_port_range(ports)
     if not port_list:
         return
 
+    if nonblocking and not banner_grab:
+        yield from _scan_ports_nonblocking(host, port_list, timeout, concurrency)
+        return
+
+    # Resolve up front so the workers don't all miss the cache at once; a
+    # failure is reported per port by _scan_single_port
+    try:
+        _resolve(host)
+    except OSError:
+        pass
+
     def scan_port(port: int) -> Dict[str, Any]:
         return _scan_single_port(host, port, timeout, banner_grab)
 
+    # Only a couple of ports per worker are queued at a time, rather than a
+    # future for every port up front, so a large scan stays small in memory
+    # and closing the generator (e.g. on cancel) only waits for in-flight ports
+    remaining = iter(port_list)
+    future_to_port = {}
+
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        future_to_port = {executor.submit(scan_port, port): port for port in port_list}
-        for future in as_completed(future_to_port):
-            try:
-                yield future.result()
-            except Exception as e:
-                port = future_to_port[future]
-                yield {
-                    "port": port,
-                    "state": "closed",
-                    "banner": None,
-                    "error": str(e),
-                }
+        def submit_next():
+            port = next(remaining, None)
+            if port is not None:
+                future_to_port[executor.submit(scan_port, port)] = port
+
+        for _ in range(concurrency * 2):
+            submit_next()
+
+        while future_to_port:
+            done, _ = wait(future_to_port, return_when=FIRST_COMPLETED)
+            for future in done:
+                port = future_to_port.pop(future)
+                submit_next()
+                try:
+                    yield future.result()
+                except Exception as e:
+                    result = _RESULT_TEMPLATE.copy()
+                    result["port"] = port
+                    result["error"] = str(e)
+                    yield result
 
 def scan_ports(
     host: str,
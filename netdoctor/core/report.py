@@ -5,7 +5,17 @@ Reporting module for exporting session data.
 import json
 import csv
 import io
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, TextIO
+
+from netdoctor.storage.history import iter_session_results
+
+# Use orjson when it is installed, it serializes large sessions several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 def export_csv(session: Dict[str, Any]) -> str:
     """
@@ -17,24 +27,49 @@ def export_csv(session: Dict[str, Any]) -> str:
     Returns:
         CSV string
     """
-    results = session.get("results", [])
-    if not results:
-        return ""
-        
     output = io.StringIO()
-    # Assume results is a list of dicts, get keys from first item
-    if isinstance(results[0], dict):
-        writer = csv.DictWriter(output, fieldnames=results[0].keys())
+    write_csv(session.get("results", []), output)
+    return output.getvalue()
+
+def export_csv_stream(session_id: str, fileobj: TextIO):
+    """
+    Export a stored session's results as CSV straight to a file object.
+    
+    Result rows are streamed from history storage, so memory use stays flat
+    regardless of the session size.
+    
+    Args:
+        session_id: ID of the session in history storage
+        fileobj: Text file object to write the CSV to
+    """
+    write_csv(iter_session_results(session_id), fileobj)
+
+def write_csv(results: Iterable[Any], fileobj: TextIO):
+    """
+    Write result items to a file object as CSV, one row at a time.
+    
+    Args:
+        results: Result items; dict items use the first item's keys as columns
+        fileobj: Text file object to write the CSV to
+    """
+    rows = iter(results)
+    first = next(rows, None)
+    if first is None:
+        return
+        
+    if isinstance(first, dict):
+        writer = csv.DictWriter(fileobj, fieldnames=first.keys())
         writer.writeheader()
-        writer.writerows(results)
+        writer.writerow(first)
+        for r in rows:
+            writer.writerow(r)
     else:
         # Fallback for non-dict results
-        writer = csv.writer(output)
+        writer = csv.writer(fileobj)
         writer.writerow(["Result"])
-        for r in results:
+        writer.writerow([str(first)])
+        for r in rows:
             writer.writerow([str(r)])
-            
-    return output.getvalue()
 
 def export_json(session: Dict[str, Any]) -> str:
     """
@@ -46,4 +81,7 @@ def export_json(session: Dict[str, Any]) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(session, indent=4)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(session, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    # Same layout as orjson's output, so the file doesn't depend on what's installed
+    return json.dumps(session, indent=2, ensure_ascii=False)
@@ -5,8 +5,28 @@ psutil wrappers for CPU, memory, disk, network interface metrics.
 """
 
 import socket
+import threading
+import time
 import psutil
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Optional, Tuple
+
+# Slow-changing parts of the overview (disk partitions with their usage, and
+# interface names/addresses/MTU), reused for _STATIC_TTL seconds
+_STATIC_TTL = 5.0
+_STATIC_CACHE: Dict[str, Any] = {"ts": 0.0, "parts": None, "if_static": None}
+_STATIC_LOCK = threading.Lock()
+
+# Seconds to wait for disk usage of all partitions before skipping the rest
+_DISK_USAGE_TIMEOUT = 2.0
+
+# Disk usage queries still running, keyed by mountpoint, so a hung mount is
+# never queried again until its first query returns
+_DISK_USAGE_PENDING: Dict[str, Future] = {}
+_DISK_USAGE_LOCK = threading.Lock()
+
+# Set once psutil has a CPU time baseline, so later samples need not block
+_cpu_primed = False
 
 
 def get_system_overview() -> Dict[str, Any]:
@@ -25,9 +45,13 @@ def get_system_overview() -> Dict[str, Any]:
         - load_avg: Load average tuple (1min, 5min, 15min) or None if unavailable (Optional[tuple])
         - interfaces: List of network interface info (List[Dict[str, Any]])
     """
-    # CPU information
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    per_cpu_percent = psutil.cpu_percent(interval=0.1, percpu=True)
+    # CPU information: one per-core sample, averaged for the overall figure.
+    # Only the first call blocks to take a baseline; later calls measure
+    # usage since the previous call, which a poller makes every second anyway
+    global _cpu_primed
+    per_cpu_percent = psutil.cpu_percent(interval=None if _cpu_primed else 0.1, percpu=True)
+    _cpu_primed = True
+    cpu_percent = sum(per_cpu_percent) / len(per_cpu_percent) if per_cpu_percent else 0.0
 
     # Memory information
     memory = psutil.virtual_memory()
@@ -41,29 +65,12 @@ def get_system_overview() -> Dict[str, Any]:
         "swap_used": swap.used,
     }
 
-    # Disk partitions
-    disk_partitions = []
-    for partition in psutil.disk_partitions():
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            disk_partitions.append(
-                {
-                    "device": partition.device,
-                    "mountpoint": partition.mountpoint,
-                    "fstype": partition.fstype,
-                    "total": usage.total,
-                    "used": usage.used,
-                    "free": usage.free,
-                }
-            )
-        except (PermissionError, OSError):
-            # Skip partitions we can't access
-            continue
+    # Disk partitions and interface addresses barely change, so they are
+    # cached for a few seconds across polls
+    disk_partitions, interfaces_static = _get_static_info()
 
     # Uptime
     uptime = psutil.boot_time()
-    import time
-
     uptime_seconds = time.time() - uptime
 
     # Load average (Unix/Linux/macOS only)
@@ -76,37 +83,12 @@ def get_system_overview() -> Dict[str, Any]:
     # Network interfaces
     interfaces = []
     net_io = psutil.net_io_counters(pernic=True)
-    net_if_addrs = psutil.net_if_addrs()
-    net_if_stats = psutil.net_if_stats()
-
-    for interface_name in net_if_addrs.keys():
-        interface_info = {
-            "name": interface_name,
-            "ip": None,
-            "ipv6": None,
-            "mac": None,
-            "mtu": None,
-            "rx_bytes": 0,
-            "tx_bytes": 0,
-        }
-
-        # Get IP addresses
-        for addr in net_if_addrs.get(interface_name, []):
-            if addr.family == socket.AF_INET:
-                interface_info["ip"] = addr.address
-            elif addr.family == socket.AF_INET6:
-                interface_info["ipv6"] = addr.address
-            elif addr.family == psutil.AF_LINK:
-                interface_info["mac"] = addr.address
-
-        # Get MTU
-        if interface_name in net_if_stats:
-            stats = net_if_stats[interface_name]
-            interface_info["mtu"] = stats.mtu
+    for interface_name, static_info in interfaces_static.items():
+        interface_info = dict(static_info, rx_bytes=0, tx_bytes=0)
 
         # Get I/O counters
-        if interface_name in net_io:
-            io = net_io[interface_name]
+        io = net_io.get(interface_name)
+        if io is not None:
             interface_info["rx_bytes"] = io.bytes_recv
             interface_info["tx_bytes"] = io.bytes_sent
 
@@ -123,3 +105,127 @@ def get_system_overview() -> Dict[str, Any]:
         "load_avg": load_avg,
         "interfaces": interfaces,
     }
+
+
+def clear_cache():
+    """Forget the cached disk partition and interface information."""
+    with _STATIC_LOCK:
+        _STATIC_CACHE.update(ts=0.0, parts=None, if_static=None)
+
+
+def _get_static_info() -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Get disk partitions and static interface info, refreshed every _STATIC_TTL seconds.
+
+    Returns copies, so callers may modify them without touching the cache.
+    """
+    now = time.monotonic()
+    with _STATIC_LOCK:
+        cached = _STATIC_CACHE["parts"] is not None and now - _STATIC_CACHE["ts"] < _STATIC_TTL
+        if cached:
+            parts, if_static = _STATIC_CACHE["parts"], _STATIC_CACHE["if_static"]
+
+    if not cached:
+        parts = _get_disk_partitions()
+        if_static = _get_interface_static_info()
+        with _STATIC_LOCK:
+            _STATIC_CACHE.update(ts=now, parts=parts, if_static=if_static)
+
+    return [dict(p) for p in parts], {name: dict(info) for name, info in if_static.items()}
+
+
+def _get_disk_partitions() -> List[Dict[str, Any]]:
+    """Get mounted partitions with their usage, skipping inaccessible ones."""
+    partitions = psutil.disk_partitions()
+    if not partitions:
+        return []
+
+    # Query usage of all mounts concurrently, and give up on any that are
+    # still hanging (e.g. an unreachable network mount) after the deadline
+    futures = [_disk_usage_future(partition.mountpoint) for partition in partitions]
+    deadline = time.monotonic() + _DISK_USAGE_TIMEOUT
+    disk_partitions = []
+    for partition, future in zip(partitions, futures):
+        try:
+            usage = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except (PermissionError, OSError, FutureTimeoutError):
+            # Skip partitions we can't access
+            continue
+        disk_partitions.append(
+            {
+                "device": partition.device,
+                "mountpoint": partition.mountpoint,
+                "fstype": partition.fstype,
+                "total": usage.total,
+                "used": usage.used,
+                "free": usage.free,
+            }
+        )
+    return disk_partitions
+
+
+def _disk_usage_future(mountpoint: str) -> Future:
+    """
+    Get a future for the disk usage of a mountpoint.
+
+    Reuses the query still pending for the mountpoint, if any. Queries run in
+    daemon threads, so a mount that never answers cannot block exit.
+    """
+    with _DISK_USAGE_LOCK:
+        future = _DISK_USAGE_PENDING.get(mountpoint)
+        if future is not None:
+            return future
+        future = Future()
+        _DISK_USAGE_PENDING[mountpoint] = future
+
+    thread = threading.Thread(
+        target=_query_disk_usage,
+        args=(mountpoint, future),
+        name=f"disk-usage-{mountpoint}",
+        daemon=True,
+    )
+    thread.start()
+    return future
+
+
+def _query_disk_usage(mountpoint: str, future: Future):
+    """Resolve future with the disk usage of mountpoint."""
+    try:
+        usage = psutil.disk_usage(mountpoint)
+    except Exception as e:
+        usage, error = None, e
+    else:
+        error = None
+
+    with _DISK_USAGE_LOCK:
+        _DISK_USAGE_PENDING.pop(mountpoint, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(usage)
+
+
+def _get_interface_static_info() -> Dict[str, Dict[str, Any]]:
+    """Get name, addresses and MTU of each network interface, keyed by name."""
+    interfaces = {}
+    net_if_addrs = psutil.net_if_addrs()
+    net_if_stats = psutil.net_if_stats()
+
+    for interface_name, addrs in net_if_addrs.items():
+        # Addresses by family (the last address of a family wins)
+        by_family = {addr.family: addr.address for addr in addrs}
+        interface_info = {
+            "name": interface_name,
+            "ip": by_family.get(socket.AF_INET),
+            "ipv6": by_family.get(socket.AF_INET6),
+            "mac": by_family.get(psutil.AF_LINK),
+            "mtu": None,
+        }
+
+        # Get MTU
+        stats = net_if_stats.get(interface_name)
+        if stats is not None:
+            interface_info["mtu"] = stats.mtu
+
+        interfaces[interface_name] = interface_info
+    return interfaces
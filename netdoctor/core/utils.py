@@ -6,50 +6,82 @@ import shutil
 import subprocess
 import re
 import importlib
-from typing import Dict, Any, Optional
+import functools
+import threading
+from typing import Dict, Any, Optional, Tuple
 
 def check_python_dependency(name: str) -> Dict[str, Any]:
     """
     Check if a Python package is installed.
     
+    The import is only attempted once per package per process.
+    
     Args:
         name: Name of the package to check
         
     Returns:
         Dictionary with status and version info
     """
+    installed, version = _import_version(name)
+    return {
+        "name": name,
+        "installed": installed,
+        "version": version,
+        "error": None if installed else "Not installed"
+    }
+
+@functools.lru_cache(maxsize=128)
+def _import_version(name: str) -> Tuple[bool, Optional[str]]:
+    """Import a package and return (installed, version)."""
     try:
         module = importlib.import_module(name)
-        version = "unknown"
-        if hasattr(module, "__version__"):
-            version = module.__version__
-        elif hasattr(module, "VERSION"):
-            version = str(module.VERSION)
-            
-        return {
-            "name": name,
-            "installed": True,
-            "version": version,
-            "error": None
-        }
     except ImportError:
-        return {
-            "name": name,
-            "installed": False,
-            "version": None,
-            "error": "Not installed"
-        }
+        return False, None
+        
+    version = "unknown"
+    if hasattr(module, "__version__"):
+        version = module.__version__
+    elif hasattr(module, "VERSION"):
+        version = str(module.VERSION)
+    return True, version
 
 def detect_nmap(custom_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Detect if nmap is installed and return its path and version.
     
+    A successful detection is remembered per custom_path for the rest of the
+    process; failures are retried on the next call. Call clear_nmap_cache()
+    to force a new lookup.
+    
     Args:
         custom_path: Optional custom path to nmap executable
         
     Returns:
         Dictionary with 'path', 'version', and 'installed' keys
     """
+    with _NMAP_LOCK:
+        cached = _NMAP_CACHE.get(custom_path)
+    if cached is not None:
+        return dict(cached)
+
+    info = _detect_nmap(custom_path)
+    # Not found, timed out or failed may be fixed by installing nmap or a
+    # retry, so only a working nmap is cached
+    if info["installed"]:
+        with _NMAP_LOCK:
+            _NMAP_CACHE[custom_path] = info
+    return dict(info)
+
+# custom_path -> detection result, for successful detections only
+_NMAP_CACHE: Dict[Optional[str], Dict[str, Any]] = {}
+_NMAP_LOCK = threading.Lock()
+
+def clear_nmap_cache():
+    """Forget all cached nmap detections."""
+    with _NMAP_LOCK:
+        _NMAP_CACHE.clear()
+
+def _detect_nmap(custom_path: Optional[str]) -> Dict[str, Any]:
     nmap_path = custom_path or shutil.which("nmap")
     
     if not nmap_path:
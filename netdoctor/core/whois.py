@@ -4,9 +4,16 @@ WHOIS wrapper module.
 WHOIS lookups via python-whois or subprocess.
 """
 
+import copy
 import subprocess
 import shutil
-from typing import Dict, Any, Optional
+import threading
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from netdoctor.config import WHOIS_CACHE_TTL, DEFAULT_WHOIS_THREADS
 
 # Try to import python-whois, but make it optional
 try:
@@ -16,13 +23,24 @@ except ImportError:
     PYTHON_WHOIS_AVAILABLE = False
     whois = None
 
+# Fields copied from python-whois results into "parsed"
+_SCALAR_FIELDS = ("domain_name", "registrar", "creation_date", "expiration_date", "updated_date")
+_LIST_FIELDS = ("name_servers", "status")
+_MISSING = object()
+
+# Successful lookups are cached per domain for WHOIS_CACHE_TTL seconds;
+# registration data changes rarely and WHOIS servers rate-limit repeat queries
+_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
 
-def query_whois(domain: str) -> Dict[str, Any]:
+def query_whois(domain: str, cached: bool = True) -> Dict[str, Any]:
     """
-    Query WHOIS information for a domain.
+    Query WHOIS information for a domain, reusing a cached result until it expires.
 
     Args:
         domain: Domain name to query (e.g., "example.com")
+        cached: If False, always query afresh (the new result is still cached)
 
     Returns:
         Dictionary with WHOIS information:
@@ -31,6 +49,69 @@ def query_whois(domain: str) -> Dict[str, Any]:
         - method: 'python-whois' or 'subprocess'
         - error: Error message if query failed
     """
+    key = domain.strip().lower()
+    now = time.monotonic()
+    # Callers get their own copy, so changing a result can't alter the cache
+    if cached:
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+        if entry is not None and now < entry[0]:
+            return copy.deepcopy(entry[1])
+
+    result = _query_whois_uncached(domain)
+    # Failures are not cached, so the next query tries again
+    if WHOIS_CACHE_TTL > 0 and result["error"] is None:
+        with _CACHE_LOCK:
+            _CACHE[key] = (now + WHOIS_CACHE_TTL, result)
+        return copy.deepcopy(result)
+    return result
+
+
+def query_whois_batch(
+    domains: List[str], concurrency: int = DEFAULT_WHOIS_THREADS
+) -> List[Dict[str, Any]]:
+    """
+    Query WHOIS information for many domains in parallel.
+
+    Each distinct domain is looked up once, however often it is listed.
+
+    Args:
+        domains: Domain names to query
+        concurrency: Maximum number of lookups in flight
+
+    Returns:
+        query_whois result dictionaries, in the same order as domains
+    """
+    unique = {}
+    for domain in domains:
+        unique.setdefault(domain.strip().lower(), domain)
+    if not unique:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(unique))) as executor:
+        results = dict(zip(unique, executor.map(query_whois, unique.values())))
+    # A domain listed twice still gets a separate dict at each position
+    return [copy.deepcopy(results[domain.strip().lower()]) for domain in domains]
+
+
+@functools.lru_cache(maxsize=1)
+def _whois_binary() -> Optional[str]:
+    """Path of the system whois client, looked up once per process."""
+    return shutil.which("whois")
+
+
+def refresh_whois_binary():
+    """Look the whois client up again on the next query, e.g. after installing it."""
+    _whois_binary.cache_clear()
+
+
+def clear_cache():
+    """Forget all cached WHOIS results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _query_whois_uncached(domain: str) -> Dict[str, Any]:
     result = {
         "raw": None,
         "parsed": None,
@@ -51,40 +132,17 @@ def query_whois(domain: str) -> Dict[str, Any]:
                 # Try to reconstruct from parsed data
                 result["raw"] = str(whois_data)
 
-            # Extract parsed information
+            # Extract parsed information. python-whois gives a list when a
+            # registry repeats a field; single-valued fields keep the first
             parsed_info = {}
-            if hasattr(whois_data, "domain_name"):
-                parsed_info["domain_name"] = (
-                    whois_data.domain_name[0] if isinstance(whois_data.domain_name, list) else whois_data.domain_name
-                )
-            if hasattr(whois_data, "registrar"):
-                parsed_info["registrar"] = whois_data.registrar
-            if hasattr(whois_data, "creation_date"):
-                parsed_info["creation_date"] = (
-                    whois_data.creation_date[0]
-                    if isinstance(whois_data.creation_date, list)
-                    else whois_data.creation_date
-                )
-            if hasattr(whois_data, "expiration_date"):
-                parsed_info["expiration_date"] = (
-                    whois_data.expiration_date[0]
-                    if isinstance(whois_data.expiration_date, list)
-                    else whois_data.expiration_date
-                )
-            if hasattr(whois_data, "updated_date"):
-                parsed_info["updated_date"] = (
-                    whois_data.updated_date[0]
-                    if isinstance(whois_data.updated_date, list)
-                    else whois_data.updated_date
-                )
-            if hasattr(whois_data, "name_servers"):
-                parsed_info["name_servers"] = (
-                    whois_data.name_servers if isinstance(whois_data.name_servers, list) else [whois_data.name_servers]
-                )
-            if hasattr(whois_data, "status"):
-                parsed_info["status"] = (
-                    whois_data.status if isinstance(whois_data.status, list) else [whois_data.status]
-                )
+            for field in _SCALAR_FIELDS:
+                value = getattr(whois_data, field, _MISSING)
+                if value is not _MISSING:
+                    parsed_info[field] = value[0] if isinstance(value, list) and value else value
+            for field in _LIST_FIELDS:
+                value = getattr(whois_data, field, _MISSING)
+                if value is not _MISSING:
+                    parsed_info[field] = value if isinstance(value, list) else [value]
 
             result["parsed"] = parsed_info
             return result
@@ -93,29 +151,35 @@ def query_whois(domain: str) -> Dict[str, Any]:
             result["error"] = f"python-whois error: {str(e)}"
 
     # Fallback to subprocess whois command
-    whois_path = shutil.which("whois")
+    whois_path = _whois_binary()
     if not whois_path:
         result["error"] = "WHOIS command not found and python-whois not available"
         return result
 
     try:
         result["method"] = "subprocess"
+        # close_fds=False lets CPython spawn via posix_spawn() instead of
+        # fork()+exec(), which is much cheaper from a large GUI process.
+        # Descriptors the app opens itself are non-inheritable by default
         whois_result = subprocess.run(
             [whois_path, domain],
             capture_output=True,
-            text=True,
             timeout=10,
             check=False,
+            close_fds=False,
         )
 
+        # Output is captured as bytes and decoded once; registries don't all
+        # send valid UTF-8, so undecodable bytes are replaced
         if whois_result.returncode == 0:
-            result["raw"] = whois_result.stdout
+            result["raw"] = whois_result.stdout.decode("utf-8", errors="replace")
         else:
             # Some whois servers return non-zero exit codes but still provide data
             if whois_result.stdout:
-                result["raw"] = whois_result.stdout
+                result["raw"] = whois_result.stdout.decode("utf-8", errors="replace")
             else:
-                result["error"] = f"WHOIS command failed: {whois_result.stderr}"
+                stderr = whois_result.stderr.decode("utf-8", errors="replace")
+                result["error"] = f"WHOIS command failed: {stderr}"
     except subprocess.TimeoutExpired:
         result["error"] = "WHOIS query timed out"
     except Exception as e:
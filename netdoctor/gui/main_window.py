@@ -67,36 +67,24 @@ class MainWindow(QMainWindow):
             self.switch_to_page(initial_page)
     
     def _initialize_views(self):
-        """Initialize all views and add them to the stacked widget."""
-        # Add Dashboard view
-        dashboard_view = self._get_or_create_view("Dashboard", DashboardView)
-        self.stacked_widget.addWidget(dashboard_view)
-        self.views["Dashboard"] = dashboard_view
-        
-        # Add System view
-        system_view = self._get_or_create_view("System", SystemView)
-        self.stacked_widget.addWidget(system_view)
-        self.views["System"] = system_view
-        
-        # Add Ping view
-        ping_view = self._get_or_create_view("Ping", PingView)
-        self.stacked_widget.addWidget(ping_view)
-        self.views["Ping"] = ping_view
+        """
+        Initialize all views and add them to the stacked widget.
 
-        # Add PortScan view
-        portscan_view = self._get_or_create_view("PortScan", PortScanView)
-        self.stacked_widget.addWidget(portscan_view)
-        self.views["PortScan"] = portscan_view
-        
-        # Add Reports view
-        reports_view = self._get_or_create_view("Reports", ReportsView)
-        self.stacked_widget.addWidget(reports_view)
-        self.views["Reports"] = reports_view
-        
-        # Add Settings view
-        settings_view = self._get_or_create_view("Settings", SettingsView)
-        self.stacked_widget.addWidget(settings_view)
-        self.views["Settings"] = settings_view
+        Views are added in sidebar order so a navigation index is also the
+        stacked widget index.
+        """
+        view_classes = {
+            "Dashboard": DashboardView,
+            "Ping": PingView,
+            "PortScan": PortScanView,
+            "System": SystemView,
+            "Reports": ReportsView,
+            "Settings": SettingsView,
+        }
+        for page_name in self.sidebar.page_button_map:
+            view = self._get_or_create_view(page_name, view_classes[page_name])
+            self.stacked_widget.addWidget(view)
+            self.views[page_name] = view
     
     def _get_or_create_view(self, page_name: str, view_class):
         """
@@ -153,14 +141,14 @@ class MainWindow(QMainWindow):
         
         return placeholder
     
-    def on_page_changed(self, page_name: str):
+    def on_page_changed(self, index: int):
         """
         Handle page change signal from sidebar.
         
         Args:
-            page_name: Name of the page to switch to
+            index: Stacked widget index of the page to switch to
         """
-        self.switch_to_page(page_name)
+        self._show_index(index)
     
     def show_toast(self, message: str, toast_type: str = "info", duration: int = 4000):
         """Show a sliding toast notification."""
@@ -189,6 +177,22 @@ class MainWindow(QMainWindow):
             # View not in stack, add it
             index = self.stacked_widget.addWidget(view)
         
+        self._show_index(index)
+        
+        # Update sidebar active state
+        self.sidebar.set_active_page(page_name)
+
+    def _show_index(self, index: int):
+        """
+        Show the stacked widget page at the given index with a transition.
+        
+        Args:
+            index: Stacked widget index of the page to show
+        """
+        view = self.stacked_widget.widget(index)
+        if view is None:
+            return
+        
         # Get current view for fade out
         current_index = self.stacked_widget.currentIndex()
         current_view = self.stacked_widget.currentWidget() if current_index >= 0 else None
@@ -199,6 +203,3 @@ class MainWindow(QMainWindow):
         # Professional cross-fade and slide transition
         from netdoctor.gui.widgets.animations import cross_fade_slide
         cross_fade_slide(current_view, view, duration=400)
-        
-        # Update sidebar active state
-        self.sidebar.set_active_page(page_name)
@@ -16,7 +16,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QSplitter,
 )
-from PySide6.QtCore import QThreadPool, Qt
+from PySide6.QtCore import Qt
 from typing import Optional
 import pyqtgraph as pg
 
@@ -28,7 +28,7 @@ from datetime import datetime
 from netdoctor.gui.widgets.results_table import ResultsTableView
 from netdoctor.gui.widgets.ui_components import SectionHeader, CardContainer, LoadingOverlay
 from netdoctor.gui.widgets.cards import KPICard
-from netdoctor.workers.task_worker import TaskWorker, WorkerSignals
+from netdoctor.workers.task_worker import TaskWorker, WorkerSignals, io_thread_pool
 from netdoctor.core import ping
 from netdoctor.storage import history
 
@@ -74,7 +74,7 @@ class PingView(QWidget):
         host_group = QVBoxLayout()
         host_group.setSpacing(8)
         host_label = QLabel("TARGET HOST")
-        host_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1px;")
+        host_label.setObjectName("fieldLabel")
         self.host_input = QLineEdit()
         self.host_input.setPlaceholderText("127.0.0.1 or example.com")
         self.host_input.setFixedHeight(40)
@@ -86,7 +86,7 @@ class PingView(QWidget):
         count_group = QVBoxLayout()
         count_group.setSpacing(8)
         count_label = QLabel("PACKET COUNT")
-        count_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1px;")
+        count_label.setObjectName("fieldLabel")
         self.count_input = QSpinBox()
         self.count_input.setMinimum(1)
         self.count_input.setMaximum(100)
@@ -154,7 +154,7 @@ class PingView(QWidget):
         table_card_layout.setSpacing(16)
         
         table_header = QLabel("RESPONSE LOG")
-        table_header.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        table_header.setObjectName("cardLabel")
         table_card_layout.addWidget(table_header)
 
         self.results_table = ResultsTableView(["seq", "host", "rtt_ms", "ttl", "status"])
@@ -169,7 +169,7 @@ class PingView(QWidget):
         chart_card_layout.setSpacing(16)
 
         chart_header = QLabel("LATENCY TREND")
-        chart_header.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        chart_header.setObjectName("cardLabel")
         chart_card_layout.addWidget(chart_header)
 
         self.chart = pg.PlotWidget()
@@ -261,8 +261,8 @@ class PingView(QWidget):
                     all_results.append(result)
             return all_results
 
-        self.current_worker = TaskWorker(ping_task, signals)
-        QThreadPool.globalInstance().start(self.current_worker)
+        self.current_worker = TaskWorker(ping_task, signals, pool=io_thread_pool())
+        self.current_worker.start()
 
     def stop_ping(self):
         """Stop ping operation."""
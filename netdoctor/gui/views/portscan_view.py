@@ -14,14 +14,14 @@ from PySide6.QtWidgets import (
     QTextEdit,
     QCheckBox,
 )
-from PySide6.QtCore import QThreadPool, Qt
+from PySide6.QtCore import Qt
 from typing import Optional
 
 import uuid
 from datetime import datetime
 
 from netdoctor import config
-from netdoctor.workers.task_worker import TaskWorker, WorkerSignals
+from netdoctor.workers.task_worker import TaskWorker, WorkerSignals, RowBatcher, io_thread_pool
 from netdoctor.core import portscanner
 from netdoctor.storage import history
 from netdoctor.gui.widgets.results_table import ResultsTableView
@@ -91,7 +91,7 @@ class PortScanView(QWidget):
         host_group = QVBoxLayout()
         host_group.setSpacing(8)
         host_label = QLabel("TARGET HOST")
-        host_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1px;")
+        host_label.setObjectName("fieldLabel")
         self.host_input = QLineEdit()
         self.host_input.setPlaceholderText("e.g., 127.0.0.1")
         self.host_input.setFixedHeight(40)
@@ -103,7 +103,7 @@ class PortScanView(QWidget):
         port_group = QVBoxLayout()
         port_group.setSpacing(8)
         port_label = QLabel("PORT RANGE")
-        port_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1px;")
+        port_label.setObjectName("fieldLabel")
         self.port_input = QLineEdit()
         self.port_input.setPlaceholderText("80,443,8000-8010")
         self.port_input.setText("80,443,8080")
@@ -116,7 +116,7 @@ class PortScanView(QWidget):
         settings_group = QVBoxLayout()
         settings_group.setSpacing(8)
         settings_label = QLabel("SCAN SETTINGS")
-        settings_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1px;")
+        settings_label.setObjectName("fieldLabel")
         
         settings_controls = QHBoxLayout()
         settings_controls.setSpacing(12)
@@ -177,7 +177,7 @@ class PortScanView(QWidget):
         results_layout.setSpacing(16)
 
         results_label = QLabel("SCAN RESULTS")
-        results_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        results_label.setObjectName("cardLabel")
         results_layout.addWidget(results_label)
 
         self.results_table = ResultsTableView(["port", "state", "service", "banner"])
@@ -223,23 +223,25 @@ class PortScanView(QWidget):
 
         # Create worker
         signals = WorkerSignals(parent=self)
-        signals.row.connect(self.on_scan_result)
+        signals.rows.connect(self.on_scan_results)
         signals.finished.connect(self.on_scan_finished)
         signals.error.connect(self.on_scan_error)
 
         def scan_task(signals, cancel_flag):
             results = []
-            for result in portscanner.scan_ports_iter(
-                host, ports, timeout=1.0, concurrency=threads, banner_grab=banner_grab
-            ):
-                if cancel_flag.is_set():
-                    break
-                signals.row.emit(result)
-                results.append(result)
+            with RowBatcher(signals.rows) as batcher:
+                for result in portscanner.scan_ports_iter(
+                    host, ports, timeout=1.0, concurrency=threads, banner_grab=banner_grab,
+                    nonblocking=True,
+                ):
+                    if cancel_flag.is_set():
+                        break
+                    batcher.add(result)
+                    results.append(result)
             return results
 
-        self.current_worker = TaskWorker(scan_task, signals)
-        QThreadPool.globalInstance().start(self.current_worker)
+        self.current_worker = TaskWorker(scan_task, signals, pool=io_thread_pool())
+        self.current_worker.start()
 
     def stop_scan(self):
         """Stop port scan."""
@@ -247,18 +249,21 @@ class PortScanView(QWidget):
             self.current_worker.cancel()
         # Do NOT call on_scan_finished here. The worker will emit finished signal.
 
-    def on_scan_result(self, result: dict):
-        """Handle scan result."""
-        self.scan_results.append(result)
+    def on_scan_results(self, results: list):
+        """Handle a batch of scan results."""
+        self.scan_results.extend(results)
 
         # Add to table
-        table_row = {
-            "port": result.get("port", ""),
-            "state": result.get("state", ""),
-            "service": self._guess_service(result.get("port", 0)),
-            "banner": "View" if result.get("banner") else "",
-        }
-        self.results_table.model.add_row(table_row)
+        table_rows = [
+            {
+                "port": result.get("port", ""),
+                "state": result.get("state", ""),
+                "service": self._guess_service(result.get("port", 0)),
+                "banner": "View" if result.get("banner") else "",
+            }
+            for result in results
+        ]
+        self.results_table.model.add_rows(table_rows)
 
     def _guess_service(self, port: int) -> str:
         """Guess service name from port number."""
@@ -15,6 +15,9 @@ from netdoctor.storage import history
 from netdoctor.core import report
 from netdoctor.gui.widgets.ui_components import SectionHeader, CardContainer
 
+# Sessions listed at a time; "Load More" appends the next page
+SESSION_PAGE_SIZE = 200
+
 class ReportsView(QWidget):
     """View for listing and exporting diagnostic history."""
     
@@ -38,6 +41,7 @@ class ReportsView(QWidget):
             "View saved diagnostic sessions and export reports",
             icon_path=str(icon_dir / "reports.svg")
         )
+        self.load_more_btn = self.header.add_action_button("Load More", self.load_more_sessions, "secondary")
         self.header.add_action_button("Refresh", self.refresh_sessions, "secondary")
         layout.addWidget(self.header)
         
@@ -82,7 +86,7 @@ class ReportsView(QWidget):
         
         details_header = QHBoxLayout()
         details_label = QLabel("SESSION DETAILS")
-        details_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        details_label.setObjectName("cardLabel")
         details_header.addWidget(details_label)
         details_header.addStretch()
         
@@ -126,8 +130,23 @@ class ReportsView(QWidget):
 
     def refresh_sessions(self):
         """Refresh the list of sessions from storage."""
-        sessions = history.list_sessions()
         self.table.setRowCount(0)
+        self.append_sessions(history.list_sessions(limit=SESSION_PAGE_SIZE))
+        self.on_selection_changed()
+        
+        if self.window() and hasattr(self.window(), "show_toast"):
+            self.window().show_toast(f"Refreshed {self.table.rowCount()} sessions", "info")
+
+    def load_more_sessions(self):
+        """Append the next page of older sessions."""
+        self.append_sessions(
+            history.list_sessions(limit=SESSION_PAGE_SIZE, offset=self.table.rowCount())
+        )
+
+    def append_sessions(self, sessions):
+        """Add sessions to the end of the table."""
+        # A short page means there is nothing older left to load
+        self.load_more_btn.setVisible(len(sessions) == SESSION_PAGE_SIZE)
         
         for session in sessions:
             row_idx = self.table.rowCount()
@@ -139,14 +158,9 @@ class ReportsView(QWidget):
             self.table.setItem(row_idx, 3, QTableWidgetItem(session.get("target", "")))
             
         # Update empty states
-        has_data = len(sessions) > 0
+        has_data = self.table.rowCount() > 0
         self.table.setVisible(has_data)
         self.list_empty_label.setVisible(not has_data)
-            
-        self.on_selection_changed()
-        
-        if self.window() and hasattr(self.window(), "show_toast"):
-            self.window().show_toast(f"Refreshed {len(sessions)} sessions", "info")
 
     def on_selection_changed(self):
         """Handle selection change in the table."""
@@ -195,9 +209,8 @@ class ReportsView(QWidget):
         
         if filename:
             try:
-                content = report.export_csv(self.current_session)
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                with open(filename, 'w', encoding='utf-8', newline='') as f:
+                    report.export_csv_stream(self.current_session['id'], f)
                 if self.window() and hasattr(self.window(), "show_toast"):
                     self.window().show_toast(f"Report saved: {os.path.basename(filename)}", "success")
             except Exception as e:
@@ -56,7 +56,7 @@ class SettingsView(QWidget):
         general_layout.setSpacing(20)
         
         general_label = QLabel("GENERAL SETTINGS")
-        general_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        general_label.setObjectName("cardLabel")
         general_layout.addWidget(general_label)
         
         # Timeouts
@@ -79,7 +79,7 @@ class SettingsView(QWidget):
         appearance_layout.setSpacing(20)
         
         appearance_label = QLabel("APPEARANCE")
-        appearance_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        appearance_label.setObjectName("cardLabel")
         appearance_layout.addWidget(appearance_label)
         
         self.theme_combo = self._add_setting_row("Theme Preference", QComboBox(), appearance_layout)
@@ -95,7 +95,7 @@ class SettingsView(QWidget):
         tools_layout.setSpacing(20)
         
         tools_label = QLabel("EXTERNAL TOOLS")
-        tools_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        tools_label.setObjectName("cardLabel")
         tools_layout.addWidget(tools_label)
         
         nmap_row = QVBoxLayout()
@@ -132,7 +132,7 @@ class SettingsView(QWidget):
         
         dep_header = QHBoxLayout()
         dep_label = QLabel("DEPENDENCY STATUS")
-        dep_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #64748b; letter-spacing: 1.5px;")
+        dep_label.setObjectName("cardLabel")
         dep_header.addWidget(dep_label)
         dep_header.addStretch()
         
@@ -159,7 +159,7 @@ class SettingsView(QWidget):
         privacy_layout.setSpacing(20)
         
         privacy_label = QLabel("PRIVACY & LEGAL")
-        privacy_label.setStyleSheet("font-size: 11px; font-weight: 800; color: #f87171; letter-spacing: 1.5px;")
+        privacy_label.setObjectName("dangerCardLabel")
         privacy_layout.addWidget(privacy_label)
         
         disclaimer = QLabel(
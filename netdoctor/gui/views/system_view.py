@@ -11,11 +11,11 @@ from PySide6.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
 )
-from PySide6.QtCore import QTimer, QThreadPool
+from PySide6.QtCore import QTimer
 from typing import Optional
 import pyqtgraph as pg
 
-from netdoctor.workers.task_worker import TaskWorker, WorkerSignals
+from netdoctor.workers.task_worker import TaskWorker, WorkerSignals, cpu_thread_pool
 from netdoctor.core import systeminfo
 from netdoctor.gui.widgets.cards import KPICard
 from netdoctor.gui.widgets.ui_components import SectionHeader, CardContainer, LoadingSpinner
@@ -30,6 +30,9 @@ class SystemView(QWidget):
         self.cpu_history = []
         self.memory_history = []
         self.max_history = 60  # Keep last 60 data points
+        # Monitoring starts a task every second; all of them share one signals object
+        self.monitoring_signals = WorkerSignals(self)
+        self.monitoring_signals.finished.connect(self.on_monitoring_update)
         self.init_ui()
         self.load_system_info()
 
@@ -147,8 +150,8 @@ class SystemView(QWidget):
         def system_task(signals, cancel_flag):
             return systeminfo.get_system_overview()
 
-        worker = TaskWorker(system_task, signals)
-        QThreadPool.globalInstance().start(worker)
+        worker = TaskWorker(system_task, signals, pool=cpu_thread_pool())
+        worker.start()
 
     def on_system_info_loaded(self, data):
         """Handle system info loaded."""
@@ -231,14 +234,11 @@ class SystemView(QWidget):
 
     def update_monitoring(self):
         """Update monitoring data."""
-        signals = WorkerSignals()
-        signals.finished.connect(self.on_monitoring_update)
-
         def monitoring_task(signals, cancel_flag):
             return systeminfo.get_system_overview()
 
-        worker = TaskWorker(monitoring_task, signals)
-        QThreadPool.globalInstance().start(worker)
+        worker = TaskWorker(monitoring_task, self.monitoring_signals, pool=cpu_thread_pool())
+        worker.start()
 
     def on_monitoring_update(self, data):
         """Handle monitoring update."""
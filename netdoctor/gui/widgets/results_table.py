@@ -3,7 +3,7 @@ Custom QTableView model for displaying results.
 """
 
 from PySide6.QtWidgets import QTableView
-from PySide6.QtCore import QAbstractTableModel, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from typing import List, Dict, Any
 
 
@@ -44,6 +44,15 @@ class ResultsTableModel(QAbstractTableModel):
         self.data_rows.append(row_data)
         self.endInsertRows()
 
+    def add_rows(self, rows: List[Dict[str, Any]]):
+        """Add several rows to the model in one insertion."""
+        if not rows:
+            return
+        first = len(self.data_rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.data_rows.extend(rows)
+        self.endInsertRows()
+
     def clear(self):
         """Clear all rows."""
         self.beginResetModel()
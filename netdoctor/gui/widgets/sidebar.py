@@ -2,10 +2,61 @@
 Sidebar navigation widget with PyDracula-style design.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QSize, QPoint
-from PySide6.QtGui import QIcon, QPixmap
-from typing import List, Tuple, Optional
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QPushButton, QButtonGroup, QLabel, QSizePolicy, QStyle, QStyleOption
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractAnimation, QPropertyAnimation, QVariantAnimation, QEasingCurve, QSize, QPoint
+)
+from PySide6.QtGui import QIcon, QPainter
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+
+from netdoctor.gui.widgets.animations import haptic_pop
+
+# Qt's QWIDGETSIZE_MAX, which PySide6 does not export
+_QWIDGETSIZE_MAX = 16777215
+
+# Shared easing curves; QEasingCurve is copied by value when assigned
+_EASE_INOUT_QUAD = QEasingCurve(QEasingCurve.InOutQuad)
+_EASE_OUT_CUBIC = QEasingCurve(QEasingCurve.OutCubic)
+
+# Navigation icon paths, resolved once at import
+_ICON_DIR = Path(__file__).resolve().parent.parent.parent / "resources" / "icons"
+_ICON_PATHS = {
+    name: str(_ICON_DIR / f"{name}.svg")
+    for name in ("dashboard", "ping", "portscan", "system", "reports", "settings")
+}
+
+
+def _paint_styled_background(widget: QWidget):
+    """Paint the stylesheet background for a widget marked WA_OpaquePaintEvent."""
+    option = QStyleOption()
+    option.initFrom(widget)
+    painter = QPainter(widget)
+    widget.style().drawPrimitive(QStyle.PE_Widget, option, painter, widget)
+
+
+class SidebarBackground(QWidget):
+    """
+    Opaque backdrop for the sidebar column.
+
+    Qt skips its own background fill for opaque widgets, so the stylesheet
+    background is painted explicitly instead.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("sidebarBackground")
+        # Allow clicks to pass through to the navigation buttons
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        # The background fills its whole rect with an opaque color, so Qt can skip
+        # painting the sidebar underneath it on every repaint
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_StaticContents, True)
+
+    def paintEvent(self, event):
+        _paint_styled_background(self)
 
 
 class ActiveIndicator(QWidget):
@@ -17,7 +68,18 @@ class ActiveIndicator(QWidget):
         self.setFixedWidth(3)
         self.setFixedHeight(24)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)  # FIX: Don't block clicks
+        # Solid bar, so the sliding animation blits it without blending the parent
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.hide()
+
+        # Reused for every move so rapid clicks retarget one animation
+        self._anim = QVariantAnimation(self)
+        self._anim.valueChanged.connect(self.move)
+        self._anim.setEasingCurve(_EASE_OUT_CUBIC)
+        self._anim.setDuration(250)
+
+    def paintEvent(self, event):
+        _paint_styled_background(self)
         
     def move_to(self, target_y: int, duration: int = 250):
         """Animate to new Y position."""
@@ -25,13 +87,16 @@ class ActiveIndicator(QWidget):
             self.move(0, target_y)
             self.show()
             return
+
+        # Already in place; a zero-length animation would still tick repaints
+        if abs(self.y() - target_y) < 2 and self._anim.state() != QAbstractAnimation.Running:
+            return
             
-        self.animation = QPropertyAnimation(self, b"pos")
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(self.pos())
-        self.animation.setEndValue(QPoint(0, target_y))
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        self.animation.start()
+        self._anim.stop()
+        self._anim.setDuration(duration)
+        self._anim.setStartValue(self.pos())
+        self._anim.setEndValue(QPoint(0, target_y))
+        self._anim.start()
 
 
 class NavigationButton(QPushButton):
@@ -41,29 +106,77 @@ class NavigationButton(QPushButton):
         super().__init__(parent)
         self.icon_path = icon_path
         self.button_text = text
+        # Label for each sidebar state, built once rather than on every toggle
+        self._expanded_text = f"   {text}"
+        self._collapsed_text = ""
         self.setObjectName("navButton")
         self.setCheckable(True)
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(50)
         
-        # Set SVG icon
-        self.setIcon(QIcon(icon_path))
-        self.setIconSize(QSize(20, 20))
-        self.setText(f"   {text}")
+        # Rasterize the SVG once at its display size so repaints blit a cached pixmap
+        icon_size = QSize(20, 20)
+        self.setIcon(QIcon(QIcon(icon_path).pixmap(icon_size)))
+        self.setIconSize(icon_size)
+        self.setText(self._expanded_text)
     
     def mousePressEvent(self, event):
         """Handle button press with haptic pop feedback."""
-        from netdoctor.gui.widgets.animations import haptic_pop
         haptic_pop(self, scale=1.03, duration=150)
         super().mousePressEvent(event)
 
 
+class NavigationContainer(QWidget):
+    """
+    Vertical stack of navigation buttons placed at fixed offsets.
+
+    The buttons never stretch, so their geometry is computed from their index
+    instead of running a layout manager on every resize or repolish.
+    """
+
+    def __init__(self, button_height: int = 50, spacing: int = 4, top_margin: int = 10, parent=None):
+        super().__init__(parent)
+        self.setObjectName("navContainer")
+        # Painted in the sidebar color so the indicator animation does not
+        # force the sidebar behind it to repaint
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.button_height = button_height
+        self.spacing = spacing
+        self.top_margin = top_margin
+        self.buttons: List[QPushButton] = []
+        self.setFixedHeight(top_margin)
+
+    def button_y(self, index: int) -> int:
+        """Return the top edge of the button at the given index."""
+        return self.top_margin + index * (self.button_height + self.spacing)
+
+    def add_button(self, button: QPushButton) -> int:
+        """Place a button below the existing ones and return its index."""
+        index = len(self.buttons)
+        self.buttons.append(button)
+        button.setParent(self)
+        button.setGeometry(0, self.button_y(index), self.width(), self.button_height)
+        button.show()
+        self.setFixedHeight(self.button_y(index) + self.button_height)
+        return index
+
+    def paintEvent(self, event):
+        _paint_styled_background(self)
+
+    def resizeEvent(self, event):
+        """Only the width can change, so reapply it to every button."""
+        super().resizeEvent(event)
+        width = event.size().width()
+        for button in self.buttons:
+            button.resize(width, self.button_height)
+
+
 class Sidebar(QWidget):
     """
     Fixed left sidebar with logo and navigation buttons.
     """
     
-    page_changed = Signal(str)
+    page_changed = Signal(int)  # Index of the selected page, in navigation order
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -76,6 +189,15 @@ class Sidebar(QWidget):
         self.current_page: Optional[str] = None
         self.is_collapsed = False
         self.button_page_map = {}
+        self.page_button_map: Dict[str, NavigationButton] = {}
+        # Indicator y per page, derived from each button's fixed slot
+        self._indicator_ys: Dict[str, int] = {}
+        # Reused for every collapse/expand so rapid toggles retarget one animation
+        self.width_animation = QPropertyAnimation(self, b"maximumWidth", self)
+        self.width_animation.setEasingCurve(_EASE_INOUT_QUAD)
+        self.width_animation.finished.connect(
+            lambda: self.setFixedWidth(self.width_animation.endValue())
+        )
         
         self.init_ui()
         
@@ -86,10 +208,8 @@ class Sidebar(QWidget):
         self.main_layout.setSpacing(0)
 
         # Background container that sits behind the navigation and logo
-        self._background = QWidget(self)
-        self._background.setObjectName("sidebarBackground")
-        # Allow clicks to pass through to the navigation buttons
-        self._background.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._background = SidebarBackground(self)
+        self.setAutoFillBackground(False)
         self._background.lower()
         self._background.show()
         
@@ -98,25 +218,24 @@ class Sidebar(QWidget):
         self.main_layout.addWidget(self.logo_widget)
         
         # Navigation container with indicator
-        self.nav_container = QWidget()
-        self.nav_layout = QVBoxLayout(self.nav_container)
-        self.nav_layout.setContentsMargins(0, 10, 0, 0)
-        self.nav_layout.setSpacing(4)
+        self.nav_container = NavigationContainer(button_height=50, spacing=4, top_margin=10)
         self.main_layout.addWidget(self.nav_container)
+
+        # Exclusive group keeps exactly one nav button checked natively
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        self.nav_group.idClicked.connect(self._on_nav_id_clicked)
         
         # Active Indicator
         self.indicator = ActiveIndicator(self.nav_container)
         
-        from pathlib import Path
-        icon_dir = Path(__file__).parent.parent.parent / "resources" / "icons"
-        
         self.add_navigation_items([
-            (str(icon_dir / "dashboard.svg"), "Dashboard"),
-            (str(icon_dir / "ping.svg"), "Ping"),
-            (str(icon_dir / "portscan.svg"), "PortScan"),
-            (str(icon_dir / "system.svg"), "System"),
-            (str(icon_dir / "reports.svg"), "Reports"),
-            (str(icon_dir / "settings.svg"), "Settings"),
+            (_ICON_PATHS["dashboard"], "Dashboard"),
+            (_ICON_PATHS["ping"], "Ping"),
+            (_ICON_PATHS["portscan"], "PortScan"),
+            (_ICON_PATHS["system"], "System"),
+            (_ICON_PATHS["reports"], "Reports"),
+            (_ICON_PATHS["settings"], "Settings"),
         ])
         
         
@@ -132,7 +251,7 @@ class Sidebar(QWidget):
         """Slide-in animation from left."""
         self.animation = QPropertyAnimation(self, b"pos")
         self.animation.setDuration(duration)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.animation.setEasingCurve(_EASE_OUT_CUBIC)
         self.animation.setStartValue(QPoint(-self.width(), self.y()))
         self.animation.setEndValue(QPoint(0, self.y()))
         self.animation.start()
@@ -144,23 +263,13 @@ class Sidebar(QWidget):
         logo_layout.setContentsMargins(25, 40, 25, 20)
         logo_layout.setSpacing(4)
         
+        # Styled through objectName rules in the app stylesheet, which is parsed once
         self.logo_label = QLabel("NetDoctor")
-        self.logo_label.setStyleSheet("""
-            font-weight: 900; 
-            font-size: 26px; 
-            color: #f1f5f9;
-            letter-spacing: -0.5px;
-        """)
+        self.logo_label.setObjectName("sidebarTitle")
         logo_layout.addWidget(self.logo_label)
         
         self.logo_tagline = QLabel("UTILITY TOOLKIT")
-        self.logo_tagline.setStyleSheet("""
-            color: #3b82f6;
-            font-size: 10px;
-            font-weight: 800;
-            letter-spacing: 1.5px;
-            text-transform: uppercase;
-        """)
+        self.logo_tagline.setObjectName("sidebarSubtitle")
         logo_layout.addWidget(self.logo_tagline)
         
         return logo_widget
@@ -170,28 +279,54 @@ class Sidebar(QWidget):
             btn = NavigationButton(icon, page_name)
             self.nav_buttons.append(btn)
             self.button_page_map[btn] = page_name
-            btn.clicked.connect(lambda checked, b=btn: self._on_button_clicked(b))
-            self.nav_layout.addWidget(btn)
+            self.page_button_map[page_name] = btn
+            index = self.nav_container.add_button(btn)
+            self.nav_group.addButton(btn, index)
+            self._indicator_ys[page_name] = (
+                self.nav_container.button_y(index)
+                + (self.nav_container.button_height - self.indicator.height()) // 2
+            )
         
         if self.nav_buttons:
             self.set_active_page(self.button_page_map[self.nav_buttons[0]])
     
-    def _on_button_clicked(self, button: NavigationButton):
-        page_name = self.button_page_map.get(button)
+    def _on_nav_id_clicked(self, index: int):
+        page_name = self.button_page_map.get(self.nav_buttons[index])
         if page_name:
             self.set_active_page(page_name)
-            self.page_changed.emit(page_name)
+            self.page_changed.emit(index)
     
     def set_active_page(self, page_name: str):
+        if page_name == self.current_page:
+            return
+
         self.current_page = page_name
-        
-        for btn in self.nav_buttons:
-            active = self.button_page_map.get(btn) == page_name
-            btn.setChecked(active)
-            if active:
-                target_y = btn.y() + (btn.height() - self.indicator.height()) // 2
-                self.indicator.move_to(target_y)
+
+        btn = self.page_button_map.get(page_name)
+        # Batch the check-state and indicator changes into a single repaint
+        self.nav_container.setUpdatesEnabled(False)
+        try:
+            if btn:
+                btn.setChecked(True)
+                self.indicator.move_to(self._indicator_ys[page_name])
+        finally:
+            self.nav_container.setUpdatesEnabled(True)
+            self.nav_container.update()
     
+    def _animate_width(self, end_width: int, duration: int = 200):
+        """
+        Animate the sidebar width by driving maximumWidth only.
+
+        The minimum width is pinned to the smaller of the two widths up front, so
+        each frame changes a single constraint instead of two.
+        """
+        self.width_animation.stop()
+        self.setMinimumWidth(min(self.width(), end_width))
+        self.width_animation.setDuration(duration)
+        self.width_animation.setStartValue(self.width())
+        self.width_animation.setEndValue(end_width)
+        self.width_animation.start()
+
     def get_current_page(self) -> Optional[str]:
         return self.current_page
     
@@ -205,10 +340,10 @@ class Sidebar(QWidget):
         if self.is_collapsed:
             return
         self.is_collapsed = True
-        self.setFixedWidth(80)
+        self._animate_width(80)
         self.indicator.hide()
         for btn in self.nav_buttons:
-            btn.setText("") # Simple collapse: hide text
+            btn.setText(btn._collapsed_text)  # Simple collapse: hide text
             btn.setFixedWidth(60)
         self.logo_widget.hide()
     
@@ -216,10 +351,11 @@ class Sidebar(QWidget):
         if not self.is_collapsed:
             return
         self.is_collapsed = False
-        self.setFixedWidth(260)
+        self._animate_width(260)
         self.indicator.show()
         for btn in self.nav_buttons:
-            btn.setText(f"   {btn.button_text}")
-            btn.setFixedWidth(-1)
+            btn.setText(btn._expanded_text)
+            btn.setMinimumWidth(0)
+            btn.setMaximumWidth(_QWIDGETSIZE_MAX)
         self.logo_widget.show()
 
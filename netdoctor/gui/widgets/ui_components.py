@@ -15,13 +15,24 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog,
     QFrame, QProgressBar, QSizePolicy
 )
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect, Signal, QPoint
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QEvent, QTimer, QVariantAnimation, QEasingCurve, QPoint
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache, QPainter
 from typing import Optional
-from netdoctor.gui.widgets.animations import scale_press
+from weakref import WeakSet
+from netdoctor.gui.widgets.animations import haptic_pop, fade_in, fade_out
 from netdoctor.gui.widgets.button_helpers import add_press_animation
 
 
+def _load_icon_pixmap(path: str, size: int) -> QPixmap:
+    """Load and rasterize an icon once per path and size via QPixmapCache."""
+    key = f"{path}@{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QIcon(path).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class CardContainer(QWidget):
     """
     General-purpose card container with elevation effect.
@@ -41,26 +52,13 @@ class CardContainer(QWidget):
     def __init__(self, parent=None, hover_elevation: bool = True):
         super().__init__(parent)
         self.setObjectName("cardContainer")
-        self.hover_elevation = hover_elevation
+        # Hover styling comes from the stylesheet's :hover rule, matched in C++;
+        # the property only opts a card in or out of it
+        self.setProperty("hoverElevation", hover_elevation)
+        self.setAttribute(Qt.WA_Hover, hover_elevation)
         
         # Set size policy to allow expansion
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-    
-    def enterEvent(self, event):
-        """Handle mouse enter for hover effect."""
-        if self.hover_elevation:
-            self.setProperty("hover", True)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        """Handle mouse leave for hover effect."""
-        if self.hover_elevation:
-            self.setProperty("hover", False)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        super().leaveEvent(event)
 
 
 class SectionHeader(QWidget):
@@ -83,9 +81,7 @@ class SectionHeader(QWidget):
         # Icon
         if icon_path:
             self.icon = QLabel()
-            from PySide6.QtGui import QIcon
-            pixmap = QIcon(icon_path).pixmap(32, 32)
-            self.icon.setPixmap(pixmap)
+            self.icon.setPixmap(_load_icon_pixmap(icon_path, 32))
             layout.addWidget(self.icon)
         
         # Title section
@@ -103,6 +99,8 @@ class SectionHeader(QWidget):
             title_layout.addWidget(subtitle_label)
         
         layout.addLayout(title_layout)
+        # Action buttons go between the title and the trailing stretch
+        self._button_insert_index = layout.count()
         layout.addStretch()
     
     def add_action_button(self, text: str, callback=None, button_type: str = "secondary"):
@@ -115,8 +113,8 @@ class SectionHeader(QWidget):
         # Add press animation
         add_press_animation(button, scale=0.96, duration=120)
         
-        layout = self.layout()
-        layout.insertWidget(layout.count() - 1, button)  # Insert before stretch
+        self.layout().insertWidget(self._button_insert_index, button)  # Insert before stretch
+        self._button_insert_index += 1
         return button
 
 
@@ -138,7 +136,6 @@ class IconButton(QPushButton):
     
     def mousePressEvent(self, event):
         """Handle button press with haptic feedback."""
-        from netdoctor.gui.widgets.animations import haptic_pop
         haptic_pop(self, scale=1.1, duration=150)
         super().mousePressEvent(event)
 
@@ -150,18 +147,26 @@ class ToastNotification(QWidget):
     
     def __init__(self, message: str, toast_type: str = "info", duration: int = 4000, parent=None):
         super().__init__(parent)
-        self.setObjectName(f"toast_{toast_type}")
+        self.setObjectName("toastNotification")
         self.duration = duration
         
         # Transparent background for the widget itself, styling applied to frame
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.SubWindow | Qt.FramelessWindowHint)
+
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+
+        # The styled frame carries the rounded background; only its corners
+        # leave the outer widget transparent
+        self._frame = QFrame(self)
+        self._frame.setObjectName(f"toast_{toast_type}")
+        outer_layout.addWidget(self._frame)
         
-        layout = QHBoxLayout(self)
+        layout = QHBoxLayout(self._frame)
         layout.setContentsMargins(15, 10, 15, 10)
         
         self.icon_label = QLabel()
-        from PySide6.QtGui import QIcon
         # Simple mapping for internal icons or use characters
         icons = {"success": "✅", "error": "❌", "info": "ℹ️", "warning": "⚠️"}
         self.icon_label.setText(icons.get(toast_type, "ℹ️"))
@@ -172,45 +177,128 @@ class ToastNotification(QWidget):
         self.message_label.setWordWrap(True)
         layout.addWidget(self.message_label, 1)
         
+        # Height is settled by adjustSize() when the toast is shown
         self.setFixedWidth(320)
-        self.adjustSize()
+
+        # Snapshot painted in place of the frame while the toast slides
+        self._cache: Optional[QPixmap] = None
+        policy = self._frame.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self._frame.setSizePolicy(policy)
+
+        # One slide animation, retargeted for the slide-in and the slide-out
+        self._slide_anim = QVariantAnimation(self)
+        self._slide_anim.valueChanged.connect(self.move)
+        self._slide_anim.finished.connect(self._on_slide_finished)
+        self._hiding = False
+        self._hide_scheduled = False
+
+    def _begin_cached_paint(self):
+        """Render the toast once so each animation frame is a single blit."""
+        self._cache = self.grab()
+        self._frame.hide()
+
+    def _end_cached_paint(self):
+        """Return to live painting once the toast is at rest."""
+        self._cache = None
+        self._frame.show()
+
+    def paintEvent(self, event):
+        if self._cache is not None:
+            QPainter(self).drawPixmap(0, 0, self._cache)
+        else:
+            super().paintEvent(event)
         
     def show_toast(self):
         """Play slide-in animation."""
         if not self.parent():
             self.show()
             return
-            
-        parent_rect = self.parent().rect()
+
+        # Toasts raised in the same event loop pass slide in together
+        _toast_batcher.add(self)
+
+    def _prepare_slide_in(self, parent_width: int):
+        """Place the toast off the parent's right edge and set up its slide."""
         margin = 20
-        end_pos = QPoint(parent_rect.width() - self.width() - margin, margin)
-        start_pos = QPoint(parent_rect.width(), margin)
+        end_pos = QPoint(parent_width - self.width() - margin, margin)
+        start_pos = QPoint(parent_width, margin)
         
         self.move(start_pos)
         self.show()
+        self._begin_cached_paint()
         
-        self.animation = QPropertyAnimation(self, b"pos")
-        self.animation.setDuration(250)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        self.animation.setStartValue(start_pos)
-        self.animation.setEndValue(end_pos)
-        self.animation.start()
+        self._slide_anim.stop()
+        self._slide_anim.setDuration(250)
+        self._slide_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._slide_anim.setStartValue(start_pos)
+        self._slide_anim.setEndValue(end_pos)
+
+    def _start_slide_in(self):
+        """Start the prepared slide and schedule the slide-out."""
+        self._slide_anim.start()
         
-        # Timer for hiding
-        QTimer.singleShot(self.duration, self.hide_toast)
+        # Timer for hiding, armed only once per toast
+        if not self._hide_scheduled:
+            self._hide_scheduled = True
+            QTimer.singleShot(self.duration, self.hide_toast)
         
     def hide_toast(self):
         """Play slide-out animation."""
+        if self._hiding:
+            return
+        self._hiding = True
+        self._slide_anim.stop()
+
         current_pos = self.pos()
         end_pos = QPoint(self.parent().width(), current_pos.y())
+        self._begin_cached_paint()
         
-        self.hide_anim = QPropertyAnimation(self, b"pos")
-        self.hide_anim.setDuration(200)
-        self.hide_anim.setEasingCurve(QEasingCurve.InCubic)
-        self.hide_anim.setStartValue(current_pos)
-        self.hide_anim.setEndValue(end_pos)
-        self.hide_anim.finished.connect(self.deleteLater)
-        self.hide_anim.start()
+        self._slide_anim.setDuration(200)
+        self._slide_anim.setEasingCurve(QEasingCurve.InCubic)
+        self._slide_anim.setStartValue(current_pos)
+        self._slide_anim.setEndValue(end_pos)
+        self._slide_anim.start()
+
+    def _on_slide_finished(self):
+        """Resume live painting after the slide-in, or delete after the slide-out."""
+        if self._hiding:
+            self.deleteLater()
+        else:
+            self._end_cached_paint()
+
+
+class _ToastBatcher:
+    """
+    Collects toasts shown in one event loop pass and slides them in together.
+
+    Toast sizes and parent geometry are settled first, then every toast is
+    positioned, then all animations start, so N toasts cost one layout pass
+    instead of N.
+    """
+
+    def __init__(self):
+        self.pending: list = []
+
+    def add(self, toast: ToastNotification):
+        if not self.pending:
+            QTimer.singleShot(0, self._flush)
+        self.pending.append(toast)
+
+    def _flush(self):
+        pending, self.pending = self.pending, []
+        # Size every toast and read every parent's geometry before any toast moves
+        parent_widths = []
+        for toast in pending:
+            toast.adjustSize()
+            parent_widths.append(toast.parent().width())
+        for toast, parent_width in zip(pending, parent_widths):
+            toast._prepare_slide_in(parent_width)
+        for toast in pending:
+            toast._start_slide_in()
+
+
+_toast_batcher = _ToastBatcher()
 
 
 class ModalDialog(QDialog):
@@ -251,6 +339,7 @@ class ModalDialog(QDialog):
         button_layout = QHBoxLayout(self.button_container)
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.addStretch()
+        self._button_insert_index = 0
         layout.addWidget(self.button_container)
     
     def add_button(self, text: str, button_type: str = "primary", callback=None):
@@ -263,8 +352,8 @@ class ModalDialog(QDialog):
         # Add press animation
         add_press_animation(button, scale=0.96, duration=120)
         
-        layout = self.button_container.layout()
-        layout.insertWidget(layout.count() - 1, button)
+        self.button_container.layout().insertWidget(self._button_insert_index, button)
+        self._button_insert_index += 1
         return button
     
     def set_content(self, widget: QWidget):
@@ -286,6 +375,15 @@ class LoadingSpinner(QLabel):
         spinner.start()
     """
     
+    # Shared by every spinner; the count is a power of two so the frame index
+    # wraps with a bitmask
+    _FRAMES = ("◐", "◓", "◑", "◒")
+    _FRAME_MASK = len(_FRAMES) - 1
+
+    # One timer drives every running spinner instead of one timer each
+    _shared_timer: Optional[QTimer] = None
+    _instances: "WeakSet[LoadingSpinner]" = WeakSet()
+    
     def __init__(self, parent=None, size: int = 32):
         super().__init__(parent)
         self.setObjectName("loadingSpinner")
@@ -293,34 +391,81 @@ class LoadingSpinner(QLabel):
         self.setAlignment(Qt.AlignCenter)
         self._is_spinning = False
         self._frame = 0
-        self._frames = ["◐", "◓", "◑", "◒"]
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_animation)
-        self._timer.setInterval(120)  # Update every 120ms for smoother animation
+        # Frames rendered once with the polished font and color, then blitted
+        self._pixmaps: Optional[list] = None
+    
+    @classmethod
+    def _tick_all(cls):
+        """
+        Advance every visible running spinner by one frame.
+
+        All text changes land in the same event loop pass, so Qt merges them
+        into one paint per window. Spinners on hidden pages are skipped.
+        """
+        for spinner in list(cls._instances):
+            try:
+                if spinner.isVisible():
+                    spinner._update_animation()
+            except RuntimeError:
+                # The underlying widget was deleted while still spinning
+                cls._instances.discard(spinner)
+        if not cls._instances:
+            cls._shared_timer.stop()
+    
+    def _render_frame(self, glyph: str) -> QPixmap:
+        """Draw one spinner glyph into a transparent pixmap of the widget's size."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(self.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        return pixmap
     
     def _update_animation(self):
         """Update spinner frame."""
         if self._is_spinning:
-            self.setText(self._frames[self._frame])
-            self._frame = (self._frame + 1) % len(self._frames)
+            if self._pixmaps is None:
+                self.ensurePolished()
+                self._pixmaps = [self._render_frame(glyph) for glyph in self._FRAMES]
+            self.setPixmap(self._pixmaps[self._frame])
+            self._frame = (self._frame + 1) & self._FRAME_MASK
+    
+    def changeEvent(self, event):
+        """Re-render the frames after a style, font or palette change."""
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange, QEvent.PaletteChange):
+            self._pixmaps = None
+        super().changeEvent(event)
     
     def start(self):
         """Start the spinner animation with fade in."""
-        from netdoctor.gui.widgets.animations import fade_in
         self._is_spinning = True
         self._frame = 0
-        self.show()
-        self._update_animation()
-        self._timer.start()
-        # Fade in
+        # Go transparent and set the first frame while still hidden, so the
+        # first paint is already the faded-in spinner
         self.setWindowOpacity(0.0)
+        self._update_animation()
+        self.show()
         fade_in(self, duration=200)
+        cls = type(self)
+        cls._instances.add(self)
+        if cls._shared_timer is None:
+            cls._shared_timer = QTimer()
+            cls._shared_timer.timeout.connect(cls._tick_all)
+            cls._shared_timer.setInterval(120)  # Update every 120ms for smoother animation
+        if not cls._shared_timer.isActive():
+            cls._shared_timer.start()
     
     def stop(self):
         """Stop the spinner animation with fade out."""
-        from netdoctor.gui.widgets.animations import fade_out
         self._is_spinning = False
-        self._timer.stop()
+        cls = type(self)
+        cls._instances.discard(self)
+        if not cls._instances and cls._shared_timer is not None:
+            cls._shared_timer.stop()
         # Fade out then hide
         fade_out(self, duration=120, on_finished=self.hide)
 
@@ -389,12 +534,10 @@ class LoadingOverlay(QWidget):
         
         # Fade in overlay background
         self.setWindowOpacity(0.0)
-        from netdoctor.gui.widgets.animations import fade_in
         self._fade_anim = fade_in(self, duration=200)
         
     def stop(self):
         """Fade out and hide."""
-        from netdoctor.gui.widgets.animations import fade_out
         self.spinner.stop()
         # Store animation to prevent garbage collection before completion
         self._fade_anim = fade_out(self, duration=150, on_finished=self.hide)
@@ -5,15 +5,13 @@ Bootstrap PySide6 application.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
-from netdoctor.gui.main_window import MainWindow
 
 
+@lru_cache(maxsize=None)
 def load_stylesheet() -> str:
-    """Load the application stylesheet."""
+    """Load the application stylesheet (read once per process)."""
     # Try the comprehensive theme file first, fall back to style.qss
     stylesheet_path = Path(__file__).parent / "gui" / "styles" / "blue_dark.qss"
     if not stylesheet_path.exists():
@@ -28,12 +26,16 @@ def load_stylesheet() -> str:
 
 def main():
     """Application entry point."""
+    # Qt and the GUI are imported here rather than at module level so that
+    # importing this module (e.g. for load_stylesheet) stays cheap
+    from PySide6.QtWidgets import QApplication
+    from netdoctor.gui.main_window import MainWindow
+
+    # High-DPI attributes would have to be set before QApplication exists, but
+    # Qt 6 always scales and uses high-DPI pixmaps; AA_EnableHighDpiScaling and
+    # AA_UseHighDpiPixmaps are deprecated no-ops there, so none are set
     app = QApplication(sys.argv)
 
-    # Enable high DPI scaling (deprecated in Qt6, but kept for compatibility)
-    # Qt6 handles this automatically by default now
-    pass
-
     # Load and apply stylesheet
     stylesheet = load_stylesheet()
     if stylesheet:
@@ -6,13 +6,37 @@ import os
 import json
 import sqlite3
 import datetime
-from typing import List, Dict, Any, Optional
+import functools
+import threading
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
 
-from netdoctor.config import STORAGE_TYPE, DB_FILENAME, JSON_HISTORY_FILENAME
+from netdoctor.config import (
+    STORAGE_TYPE, DB_FILENAME, JSON_HISTORY_FILENAME, JSON_HISTORY_INDEX_FILENAME,
+    LEGACY_JSON_HISTORY_FILENAME,
+)
 
+# Use orjson when it is installed, it serializes session payloads several times
+# faster. orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# error handling covers both
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+@functools.lru_cache(maxsize=1)
 def get_app_data_dir() -> Path:
-    """Get the application data directory."""
+    """Get the application data directory (resolved and created once)."""
     if os.name == 'nt':
         app_data = Path(os.getenv('APPDATA', os.path.expanduser('~'))) / 'NetDoctor'
     else:
@@ -21,25 +45,68 @@ def get_app_data_dir() -> Path:
     app_data.mkdir(parents=True, exist_ok=True)
     return app_data
 
+# One connection is opened per database path and reused for every call
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_PATH: Optional[Path] = None
+_CONN_LOCK = threading.RLock()
+
 def _get_sqlite_conn():
-    """Get a connection to the SQLite database."""
+    """Get the shared connection to the SQLite database, opening it on first use."""
+    global _CONN, _CONN_PATH
     db_path = get_app_data_dir() / DB_FILENAME
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    
-    # Create table if it doesn't exist
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS sessions (
-            id TEXT PRIMARY KEY,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            tool TEXT,
-            target TEXT,
-            meta TEXT,
-            results TEXT
-        )
-    ''')
-    conn.commit()
-    return conn
+    with _CONN_LOCK:
+        if _CONN is None or _CONN_PATH != db_path:
+            _close_sqlite_conn()
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            # WAL lets the GUI read history while a worker saves a session. It
+            # keeps -wal/-shm sidecar files next to the database in the app data dir
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-8000")
+            
+            # Create table if it doesn't exist
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id TEXT PRIMARY KEY,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    tool TEXT,
+                    target TEXT,
+                    meta TEXT,
+                    results TEXT
+                )
+            ''')
+            # One row per result item; sessions.results is only read for rows
+            # saved before this table existed
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS results (
+                    session_id TEXT,
+                    seq INTEGER,
+                    payload TEXT
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_session ON results (session_id, seq)")
+            # Covers the session listing, so it is an index walk instead of a scan and sort
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_ts ON sessions (timestamp DESC, id, tool, target)"
+            )
+            _CONN, _CONN_PATH = conn, db_path
+        return _CONN
+
+def _row_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor yielding sqlite3.Row, for the reads that build dicts by column name."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    return cursor
+
+def _close_sqlite_conn():
+    """Close the shared SQLite connection, if one is open."""
+    global _CONN, _CONN_PATH
+    with _CONN_LOCK:
+        if _CONN is not None:
+            _CONN.close()
+        _CONN, _CONN_PATH = None, None
 
 def save_session(session_id: str, meta: Dict[str, Any], results: List[Any]):
     """
@@ -50,82 +117,169 @@ def save_session(session_id: str, meta: Dict[str, Any], results: List[Any]):
         meta: Metadata dictionary (tool, target, etc.)
         results: List of result items
     """
+    save_sessions_bulk([(session_id, meta, results)])
+
+def save_sessions_bulk(items: List[Tuple[str, Dict[str, Any], List[Any]]]):
+    """
+    Save several diagnostic sessions in one write.
+    
+    Args:
+        items: (session_id, meta, results) tuples, as taken by save_session
+    """
     if STORAGE_TYPE == "sqlite":
-        _save_sqlite(session_id, meta, results)
+        _save_sqlite(items)
     else:
-        _save_json(session_id, meta, results)
+        _save_json(items)
 
-def _save_sqlite(session_id: str, meta: Dict[str, Any], results: List[Any]):
+def _save_sqlite(items: List[Tuple[str, Dict[str, Any], List[Any]]]):
     conn = _get_sqlite_conn()
-    tool = meta.get("tool", "unknown")
-    target = meta.get("target", "unknown")
-    
-    # Convert meta and results to JSON strings
-    meta_json = json.dumps(meta)
-    results_json = json.dumps(results)
     
-    conn.execute(
-        "INSERT OR REPLACE INTO sessions (id, tool, target, meta, results) VALUES (?, ?, ?, ?, ?)",
-        (session_id, tool, target, meta_json, results_json)
+    # Convert meta and each result item to JSON strings
+    session_rows = [
+        (session_id, meta.get("tool", "unknown"), meta.get("target", "unknown"), _dumps(meta))
+        for session_id, meta, _ in items
+    ]
+    result_rows = (
+        (session_id, seq, _dumps(item))
+        for session_id, _, results in items
+        for seq, item in enumerate(results)
     )
-    conn.commit()
-    conn.close()
-
-def _save_json(session_id: str, meta: Dict[str, Any], results: List[Any]):
-    history_path = get_app_data_dir() / JSON_HISTORY_FILENAME
-    history = {}
     
-    if history_path.exists():
+    # All sessions go into a single transaction, so a batch costs one commit
+    with _CONN_LOCK:
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
-            
-    history[session_id] = {
-        "id": session_id,
-        "timestamp": datetime.datetime.now().isoformat(),
-        "tool": meta.get("tool", "unknown"),
-        "target": meta.get("target", "unknown"),
-        "meta": meta,
-        "results": results
-    }
+            conn.executemany(
+                "INSERT OR REPLACE INTO sessions (id, tool, target, meta, results) VALUES (?, ?, ?, ?, NULL)",
+                session_rows
+            )
+            conn.executemany(
+                "DELETE FROM results WHERE session_id = ?",
+                [(row[0],) for row in session_rows]
+            )
+            conn.executemany(
+                "INSERT INTO results (session_id, seq, payload) VALUES (?, ?, ?)",
+                result_rows
+            )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+def _save_json(items: List[Tuple[str, Dict[str, Any], List[Any]]]):
+    log_path, index_path = _json_paths()
+    _migrate_legacy_json(log_path, index_path)
     
-    with open(history_path, 'w') as f:
-        json.dump(history, f, indent=4)
+    timestamp = datetime.datetime.now().isoformat()
+    _append_json_records(
+        [
+            {
+                "id": session_id,
+                "timestamp": timestamp,
+                "tool": meta.get("tool", "unknown"),
+                "target": meta.get("target", "unknown"),
+                "meta": meta,
+                "results": results
+            }
+            for session_id, meta, results in items
+        ],
+        log_path,
+        index_path,
+    )
 
-def list_sessions() -> List[Dict[str, Any]]:
-    """List all saved sessions."""
+# JSON storage is an append-only JSON Lines log with one session per line, plus
+# an index log of each session's summary fields and byte offset. Saving appends
+# to both; listing reads only the index; loading seeks straight to one line.
+# When an id is saved again, its latest entry wins.
+_JSON_LOCK = threading.Lock()
+
+def _json_paths() -> Tuple[Path, Path]:
+    data_dir = get_app_data_dir()
+    return data_dir / JSON_HISTORY_FILENAME, data_dir / JSON_HISTORY_INDEX_FILENAME
+
+def _append_json_records(records: List[Dict[str, Any]], log_path: Path, index_path: Path):
+    lines = []
+    index_lines = []
+    with _JSON_LOCK:
+        with open(log_path, 'ab') as log:
+            offset = log.tell()
+            for record in records:
+                line = _dumps(record).encode() + b"\n"
+                lines.append(line)
+                index_entry = {key: record[key] for key in ("id", "timestamp", "tool", "target")}
+                index_entry["offset"] = offset
+                index_lines.append(_dumps(index_entry).encode() + b"\n")
+                offset += len(line)
+            log.write(b"".join(lines))
+        with open(index_path, 'ab') as index:
+            index.write(b"".join(index_lines))
+
+def _read_json_index(index_path: Path) -> Dict[str, Dict[str, Any]]:
+    entries = {}
+    with open(index_path, 'rb') as f:
+        for line in f:
+            try:
+                entry = _loads(line)
+            except json.JSONDecodeError:
+                continue  # A torn line from an interrupted write
+            entries[entry["id"]] = entry
+    return entries
+
+def _migrate_legacy_json(log_path: Path, index_path: Path):
+    """Convert a pre-JSONL history.json into the log, once."""
+    legacy_path = log_path.parent / LEGACY_JSON_HISTORY_FILENAME
+    if log_path.exists() or not legacy_path.exists():
+        return
+    try:
+        with open(legacy_path, 'r') as f:
+            history = _loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return
+    _append_json_records(list(history.values()), log_path, index_path)
+
+def list_sessions(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+    """
+    List saved sessions.
+    
+    Args:
+        limit: Maximum number of sessions to return, or None for all of them
+        offset: Number of sessions to skip, for paging through the history
+    """
     if STORAGE_TYPE == "sqlite":
-        return _list_sqlite()
+        return _list_sqlite(limit, offset)
     else:
-        return _list_json()
+        # Newest first, like the SQLite backend; the index is in save order,
+        # so reversing it first keeps later saves ahead on equal timestamps
+        sessions = sorted(reversed(_list_json()), key=lambda s: s["timestamp"], reverse=True)
+        return sessions[offset:offset + limit if limit is not None else None]
 
-def _list_sqlite() -> List[Dict[str, Any]]:
+def _list_sqlite(limit: Optional[int], offset: int) -> List[Dict[str, Any]]:
     conn = _get_sqlite_conn()
-    cursor = conn.execute("SELECT id, timestamp, tool, target FROM sessions ORDER BY timestamp DESC")
-    sessions = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    with _CONN_LOCK:
+        cursor = _row_cursor(conn).execute(
+            "SELECT id, timestamp, tool, target FROM sessions ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+            (limit if limit is not None else -1, offset)
+        )
+        sessions = [dict(row) for row in cursor.fetchall()]
     return sessions
 
 def _list_json() -> List[Dict[str, Any]]:
-    history_path = get_app_data_dir() / JSON_HISTORY_FILENAME
-    if not history_path.exists():
+    log_path, index_path = _json_paths()
+    _migrate_legacy_json(log_path, index_path)
+    if not index_path.exists():
         return []
         
     try:
-        with open(history_path, 'r') as f:
-            history = json.load(f)
-            return [
-                {
-                    "id": s["id"],
-                    "timestamp": s["timestamp"],
-                    "tool": s["tool"],
-                    "target": s["target"]
-                }
-                for s in history.values()
-            ]
-    except (json.JSONDecodeError, OSError):
+        return [
+            {
+                "id": entry["id"],
+                "timestamp": entry["timestamp"],
+                "tool": entry["tool"],
+                "target": entry["target"]
+            }
+            for entry in _read_json_index(index_path).values()
+        ]
+    except OSError:
         return []
 
 def load_session(session_id: str) -> Optional[Dict[str, Any]]:
@@ -137,25 +291,117 @@ def load_session(session_id: str) -> Optional[Dict[str, Any]]:
 
 def _load_sqlite(session_id: str) -> Optional[Dict[str, Any]]:
     conn = _get_sqlite_conn()
-    cursor = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with _CONN_LOCK:
+        cursor = _row_cursor(conn).execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
+        row = cursor.fetchone()
     
     if row:
         session = dict(row)
-        session["meta"] = json.loads(session["meta"])
-        session["results"] = json.loads(session["results"])
+        session["meta"] = _loads(session["meta"])
+        if session["results"] is not None:
+            session["results"] = _loads(session["results"])
+        else:
+            session["results"] = list(_iter_results_sqlite(session_id))
         return session
     return None
 
+def iter_session_results(session_id: str) -> Iterator[Any]:
+    """
+    Yield a session's result items in order without loading the whole session.
+
+    With SQLite storage the items are read from the results table in chunks.
+    """
+    if STORAGE_TYPE == "sqlite":
+        conn = _get_sqlite_conn()
+        with _CONN_LOCK:
+            row = conn.execute("SELECT results FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is not None and row[0] is not None:
+            yield from _loads(row[0])
+        else:
+            yield from _iter_results_sqlite(session_id)
+    else:
+        session = _load_json(session_id)
+        if session:
+            yield from session.get("results", [])
+
+def _iter_results_sqlite(session_id: str, chunk_size: int = 500) -> Iterator[Any]:
+    conn = _get_sqlite_conn()
+    with _CONN_LOCK:
+        cursor = conn.execute(
+            "SELECT payload FROM results WHERE session_id = ? ORDER BY seq", (session_id,)
+        )
+    while True:
+        with _CONN_LOCK:
+            rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        for row in rows:
+            yield _loads(row[0])
+
 def _load_json(session_id: str) -> Optional[Dict[str, Any]]:
-    history_path = get_app_data_dir() / JSON_HISTORY_FILENAME
-    if not history_path.exists():
+    log_path, index_path = _json_paths()
+    _migrate_legacy_json(log_path, index_path)
+    if not index_path.exists():
         return None
         
     try:
-        with open(history_path, 'r') as f:
-            history = json.load(f)
-            return history.get(session_id)
+        entry = _read_json_index(index_path).get(session_id)
+        if entry is None:
+            return None
+        session = _read_json_record(log_path, entry["offset"])
+        if session is None or session.get("id") != session_id:
+            # The index is stale (e.g. a compaction was interrupted), rebuild it
+            with _JSON_LOCK:
+                _rebuild_json_index(log_path, index_path)
+            entry = _read_json_index(index_path).get(session_id)
+            session = _read_json_record(log_path, entry["offset"]) if entry else None
+        return session
     except (json.JSONDecodeError, OSError):
         return None
+
+def _read_json_record(log_path: Path, offset: int) -> Optional[Dict[str, Any]]:
+    with open(log_path, 'rb') as f:
+        f.seek(offset)
+        line = f.readline()
+    return _loads(line) if line else None
+
+def compact_json_history():
+    """
+    Rewrite the JSON history log keeping only the latest record of each session.
+    
+    The log is written to a temporary file and swapped in with os.replace, so
+    an interruption leaves either the old or the new log intact.
+    """
+    log_path, index_path = _json_paths()
+    if not index_path.exists():
+        return
+        
+    with _JSON_LOCK:
+        entries = _read_json_index(index_path)
+        tmp_path = log_path.with_suffix(log_path.suffix + ".tmp")
+        with open(log_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            for entry in entries.values():
+                src.seek(entry["offset"])
+                dst.write(src.readline())
+        os.replace(tmp_path, log_path)
+        _rebuild_json_index(log_path, index_path)
+
+def _rebuild_json_index(log_path: Path, index_path: Path):
+    """Regenerate the index from the log, replacing it atomically."""
+    index_lines = []
+    offset = 0
+    with open(log_path, 'rb') as f:
+        for line in f:
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if record is not None:
+                index_entry = {key: record[key] for key in ("id", "timestamp", "tool", "target")}
+                index_entry["offset"] = offset
+                index_lines.append(_dumps(index_entry).encode() + b"\n")
+            offset += len(line)
+    tmp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(b"".join(index_lines))
+    os.replace(tmp_path, index_path)
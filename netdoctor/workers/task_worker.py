@@ -4,8 +4,11 @@ QRunnable implementation for background task execution.
 Workers accept cancellation flags and emit progress, error, and finished signals.
 """
 
+import os
 import threading
-from typing import Callable, Any, Optional
+import time
+import traceback
+from typing import Callable, Any, Optional, List, Dict
 from PySide6.QtCore import QObject, QRunnable, Signal, QThreadPool
 
 
@@ -17,11 +20,63 @@ class WorkerSignals(QObject):
 
     progress = Signal(int)  # Progress percentage (0-100)
     row = Signal(dict)  # Emit a row of data (dict)
+    rows = Signal(list)  # Emit a batch of rows (list of dicts), see RowBatcher
     log = Signal(str)  # Emit a log message
     error = Signal(str)  # Emit an error message
     finished = Signal(object)  # Emit final result object
 
 
+class RowBatcher:
+    """
+    Collects rows in a worker thread and emits them in batches.
+
+    Every cross-thread emission is a queued call on the GUI event loop, so a
+    task that produces many rows quickly should emit them through a batcher
+    connected to WorkerSignals.rows instead of emitting row once per result.
+    A batch is emitted once it holds max_rows rows or flush_ms has passed
+    since the last emission. There is no timer (the worker thread has no
+    event loop): the interval is only checked in add(), so rows queued
+    before a slow stretch wait for the next add(). Call flush() (or use it
+    as a context manager) to emit the remainder.
+
+    Usage example:
+        ```python
+        def scan_task(signals, cancel_flag):
+            with RowBatcher(signals.rows) as batcher:
+                for result in results_iter():
+                    batcher.add(result)
+        ```
+    """
+
+    def __init__(self, signal, flush_ms: int = 50, max_rows: int = 100):
+        self.signal = signal
+        self.flush_interval = flush_ms / 1000
+        self.max_rows = max_rows
+        self._rows: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, row: Dict[str, Any]):
+        """Queue a row, emitting the batch if it is full or flush_ms has passed."""
+        self._rows.append(row)
+        if (len(self._rows) >= self.max_rows
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Emit any queued rows."""
+        if self._rows:
+            self.signal.emit(self._rows)
+            self._rows = []
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+
 class TaskWorker(QRunnable):
     """
     QRunnable worker that wraps a callable and supports cancellation.
@@ -30,6 +85,11 @@ class TaskWorker(QRunnable):
     for progress, results, errors, and completion. Supports graceful cancellation
     via a thread-safe Event flag.
 
+    Sweep-style tasks that repeat lookups should call the caching core
+    helpers (dns.query_records, whois.query_whois, the port scanner's host
+    resolution) rather than keeping caches of their own; those caches are
+    shared by every worker thread and expire on their own.
+
     Usage example:
         ```python
         from PySide6.QtCore import QThreadPool
@@ -65,6 +125,7 @@ class TaskWorker(QRunnable):
         self,
         func: Callable[[WorkerSignals, threading.Event], Any],
         signals: Optional[WorkerSignals] = None,
+        pool: Optional[QThreadPool] = None,
     ):
         """
         Initialize TaskWorker.
@@ -74,10 +135,13 @@ class TaskWorker(QRunnable):
                   The function should check cancel_flag.is_set() periodically
                   and return a result object when complete.
             signals: Optional WorkerSignals instance. If None, creates a new one.
+            pool: Thread pool used by start(), e.g. io_thread_pool() for
+                  network-bound tasks. Defaults to the global instance.
         """
         super().__init__()
         self.func = func
         self.signals = signals if signals is not None else WorkerSignals()
+        self.pool = pool
         self._cancel = threading.Event()
         self._result = None
         self._error = None
@@ -89,20 +153,29 @@ class TaskWorker(QRunnable):
         Catches exceptions and emits error signals. Emits finished signal
         with the function's return value (or None if cancelled/errored).
         """
+        self.signals.log.emit("Task started")
+        # Only the task itself is guarded, so a failure while emitting can
+        # never be reported as a task error or emit finished twice
         try:
-            self.signals.log.emit("Task started")
             self._result = self.func(self.signals, self._cancel)
-            if self._cancel.is_set():
-                self.signals.log.emit("Task cancelled")
-                self.signals.finished.emit(None)
-            else:
-                self.signals.log.emit("Task completed")
-                self.signals.finished.emit(self._result)
         except Exception as e:
-            error_msg = f"Task error: {str(e)}"
-            self._error = error_msg
-            self.signals.error.emit(error_msg)
+            summary = traceback.format_exception_only(type(e), e)[-1].strip()
+            self._error = f"Task error: {summary}"
+            self.signals.error.emit(self._error)
             self.signals.finished.emit(None)
+            return
+
+        if self._cancel.is_set():
+            self.signals.log.emit("Task cancelled")
+            self.signals.finished.emit(None)
+        else:
+            self.signals.log.emit("Task completed")
+            self.signals.finished.emit(self._result)
+
+    def start(self):
+        """Queue the worker on its thread pool."""
+        pool = self.pool if self.pool is not None else QThreadPool.globalInstance()
+        pool.start(self)
 
     def cancel(self):
         """
@@ -117,3 +190,27 @@ class TaskWorker(QRunnable):
     def is_cancelled(self) -> bool:
         """Check if cancellation has been requested."""
         return self._cancel.is_set()
+
+
+# Network-bound tasks mostly wait on sockets and subprocesses, so they get a
+# wider pool than CPU-bound ones, and neither can starve the other
+_io_pool: Optional[QThreadPool] = None
+_cpu_pool: Optional[QThreadPool] = None
+
+
+def io_thread_pool() -> QThreadPool:
+    """Get the shared thread pool for network-bound tasks (ping, scans, DNS)."""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = QThreadPool()
+        _io_pool.setMaxThreadCount(min(64, (os.cpu_count() or 1) * 8))
+    return _io_pool
+
+
+def cpu_thread_pool() -> QThreadPool:
+    """Get the shared thread pool for CPU-bound and local system tasks."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = QThreadPool()
+        _cpu_pool.setMaxThreadCount(os.cpu_count() or 1)
+    return _cpu_pool
@@ -7,7 +7,15 @@ from unittest.mock import Mock, patch, MagicMock
 import dns.resolver
 import dns.exception
 
-from netdoctor.core.dns import query_records
+from netdoctor.core.dns import query_records, clear_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test without cached lookups."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 @patch("dns.resolver.resolve")
@@ -242,3 +250,28 @@ def test_query_records_all_types_structure(mock_resolve):
         assert record_type in results
         assert isinstance(results[record_type], list)
 
+
+@patch("dns.resolver.resolve")
+def test_query_records_cached(mock_resolve):
+    """Test that repeat lookups are served from the cache until the TTL expires."""
+    mock_answer = Mock()
+    mock_answer.__str__ = Mock(return_value="192.0.2.1")
+    mock_answer.ttl = 300
+
+    def resolve_side_effect(domain, record_type):
+        if record_type == "A":
+            return [mock_answer]
+        raise dns.resolver.NoAnswer()
+
+    mock_resolve.side_effect = resolve_side_effect
+
+    first = query_records("example.com")
+    calls = mock_resolve.call_count
+    first["A"].clear()  # Changing a returned result must not touch the cache
+    second = query_records("example.com")
+    assert second["A"][0]["value"] == "192.0.2.1"
+    assert mock_resolve.call_count == calls
+
+    with patch("netdoctor.core.dns.time.monotonic", return_value=float("inf")):
+        query_records("example.com")
+    assert mock_resolve.call_count == calls * 2
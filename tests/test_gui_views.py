@@ -11,6 +11,7 @@ from PySide6.QtCore import Qt
 from netdoctor.gui.views.ping_view import PingView
 from netdoctor.gui.views.system_view import SystemView
 from netdoctor.gui.views.portscan_view import PortScanView
+from netdoctor.gui.views import reports_view
 
 
 @pytest.fixture
@@ -80,3 +81,28 @@ def test_portscan_view_ui_elements(app):
     assert view.stop_button is not None
     assert view.results_table is not None
 
+
+def test_reports_view_load_more(app, monkeypatch):
+    """Test that Load More appends only the next page of sessions."""
+    sessions = [
+        {"id": f"s{i}", "timestamp": f"2024-01-0{9 - i}", "tool": "Ping", "target": "host"}
+        for i in range(5)
+    ]
+    calls = []
+
+    def list_sessions(limit=None, offset=0):
+        calls.append((limit, offset))
+        return sessions[offset:offset + limit]
+
+    monkeypatch.setattr(reports_view, "SESSION_PAGE_SIZE", 2)
+    monkeypatch.setattr(reports_view.history, "list_sessions", list_sessions)
+
+    view = reports_view.ReportsView()
+    view.load_more_sessions()
+    view.load_more_sessions()
+
+    assert calls == [(2, 0), (2, 2), (2, 4)]
+    assert [view.table.item(row, 0).text() for row in range(view.table.rowCount())] == [
+        "s0", "s1", "s2", "s3", "s4"
+    ]
+    assert view.load_more_btn.isHidden()
@@ -1,6 +1,7 @@
 import os
 import pytest
 import tempfile
+import io
 import json
 from pathlib import Path
 from netdoctor.storage import history
@@ -12,8 +13,11 @@ def temp_storage(monkeypatch):
     """Fixture to use a temporary directory for storage."""
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_path = Path(tmpdir)
+        history.get_app_data_dir.cache_clear()
         monkeypatch.setattr(history, "get_app_data_dir", lambda: tmp_path)
         yield tmp_path
+        # Release the cached connection before the directory is removed
+        history._close_sqlite_conn()
 
 def test_save_load_sqlite(temp_storage, monkeypatch):
     """Test saving and loading a session using SQLite."""
@@ -72,6 +76,15 @@ def test_export_csv():
     assert "80,open,http" in csv_out
     assert "443,open,https" in csv_out
 
+def test_export_csv_stream(temp_storage):
+    """Test streaming a stored session to a CSV file object."""
+    results = [{"port": 80, "state": "open"}, {"port": 443, "state": "closed"}]
+    history.save_session("test_csv", {"tool": "PortScan", "target": "host"}, results)
+
+    output = io.StringIO()
+    report.export_csv_stream("test_csv", output)
+    assert output.getvalue().splitlines() == ["port,state", "80,open", "443,closed"]
+
 def test_export_json():
     """Test JSON export logic."""
     session = {"id": "123", "results": [1, 2, 3]}
@@ -79,3 +92,91 @@ def test_export_json():
     loaded = json.loads(json_out)
     assert loaded["id"] == "123"
     assert loaded["results"] == [1, 2, 3]
+
+def test_export_json_same_without_orjson(monkeypatch):
+    """Test that the JSON export is identical with and without orjson."""
+    session = {"id": "123", "target": "café.example", "results": [{"port": 80}]}
+    with_orjson = report.export_json(session)
+    monkeypatch.setattr(report, "ORJSON_AVAILABLE", False)
+    assert report.export_json(session) == with_orjson
+
+def test_iter_session_results_sqlite(temp_storage):
+    """Test streaming a saved session's results back in order."""
+    results = [{"port": port, "state": "open"} for port in range(1200)]
+    history.save_session("test_iter", {"tool": "PortScan", "target": "host"}, results)
+
+    assert list(history.iter_session_results("test_iter")) == results
+
+    # Saving again under the same id replaces the previous results
+    history.save_session("test_iter", {"tool": "PortScan", "target": "host"}, results[:2])
+    assert history.load_session("test_iter")["results"] == results[:2]
+
+def test_save_sessions_bulk(temp_storage):
+    """Test saving several sessions in one call."""
+    history.save_sessions_bulk([
+        ("bulk_1", {"tool": "Ping", "target": "10.0.0.1"}, [{"seq": 1}]),
+        ("bulk_2", {"tool": "Ping", "target": "10.0.0.2"}, [{"seq": 1}, {"seq": 2}]),
+    ])
+
+    assert {s["id"] for s in history.list_sessions()} == {"bulk_1", "bulk_2"}
+    assert history.load_session("bulk_2")["results"] == [{"seq": 1}, {"seq": 2}]
+
+def test_json_log_storage(temp_storage, monkeypatch):
+    """Test the JSON Lines storage, including re-saving and legacy migration."""
+    monkeypatch.setattr(history, "STORAGE_TYPE", "json")
+
+    legacy = {"old": {"id": "old", "timestamp": "2024-01-01T00:00:00", "tool": "Ping",
+                      "target": "a", "meta": {}, "results": [1]}}
+    (temp_storage / config.LEGACY_JSON_HISTORY_FILENAME).write_text(json.dumps(legacy))
+
+    history.save_session("new", {"tool": "PortScan", "target": "b"}, [{"port": 22}])
+    history.save_session("new", {"tool": "PortScan", "target": "b"}, [{"port": 80}])
+
+    assert [s["id"] for s in history.list_sessions()] == ["new", "old"]
+    assert history.load_session("old")["results"] == [1]
+    assert history.load_session("new")["results"] == [{"port": 80}]
+    assert history.load_session("missing") is None
+
+def test_compact_json_history(temp_storage, monkeypatch):
+    """Test that compaction keeps only the latest record per session."""
+    monkeypatch.setattr(history, "STORAGE_TYPE", "json")
+
+    for port in (22, 80, 443):
+        history.save_session("scan", {"tool": "PortScan", "target": "b"}, [{"port": port}])
+    history.save_session("ping", {"tool": "Ping", "target": "a"}, [{"seq": 1}])
+
+    history.compact_json_history()
+
+    log_lines = (temp_storage / config.JSON_HISTORY_FILENAME).read_text().splitlines()
+    assert len(log_lines) == 2
+    assert [s["id"] for s in history.list_sessions()] == ["ping", "scan"]
+    assert history.load_session("scan")["results"] == [{"port": 443}]
+    assert history.load_session("ping")["results"] == [{"seq": 1}]
+
+def test_list_sessions_paged(temp_storage):
+    """Test listing sessions a page at a time, newest first."""
+    history.save_sessions_bulk([
+        (f"page_{i}", {"tool": "Ping", "target": "host"}, []) for i in range(5)
+    ])
+    conn = history._get_sqlite_conn()
+    for i in range(5):
+        conn.execute("UPDATE sessions SET timestamp = ? WHERE id = ?", (f"2024-01-0{i + 1}", f"page_{i}"))
+
+    assert [s["id"] for s in history.list_sessions(limit=2)] == ["page_4", "page_3"]
+    assert [s["id"] for s in history.list_sessions(limit=2, offset=2)] == ["page_2", "page_1"]
+    assert len(history.list_sessions()) == 5
+
+def test_list_sessions_paged_json(temp_storage, monkeypatch):
+    """Test that the JSON backend also pages newest first."""
+    monkeypatch.setattr(history, "STORAGE_TYPE", "json")
+    # Stored out of timestamp order, so save order alone would page wrongly
+    legacy = {
+        f"page_{i}": {"id": f"page_{i}", "timestamp": f"2024-01-0{i + 1}T00:00:00",
+                      "tool": "Ping", "target": "host", "meta": {}, "results": []}
+        for i in (2, 0, 4, 1, 3)
+    }
+    (temp_storage / config.LEGACY_JSON_HISTORY_FILENAME).write_text(json.dumps(legacy))
+
+    assert [s["id"] for s in history.list_sessions(limit=2)] == ["page_4", "page_3"]
+    assert [s["id"] for s in history.list_sessions(limit=2, offset=2)] == ["page_2", "page_1"]
+    assert [s["id"] for s in history.list_sessions(offset=4)] == ["page_0"]
@@ -109,6 +109,16 @@ Request timed out.
     assert results[3]["success"] is False
 
 
+def test_parse_ping_output_windows_fractional_time():
+    """Test parsing Windows ping replies with fractional latencies."""
+    output = """Reply from 10.0.0.1: bytes=32 time=12.5ms TTL=57
+"""
+    results = _parse_ping_output_windows(output, "10.0.0.1")
+    assert len(results) == 1
+    assert results[0]["rtt_ms"] == 12.5
+    assert results[0]["ttl"] == 57
+
+
 @pytest.mark.network
 def test_ping_host_localhost():
     """Test pinging localhost (requires network, marked to skip in CI)."""
@@ -171,6 +181,7 @@ def test_ping_host_uses_raw_socket_when_available(mock_subprocess, mock_raw):
     mock_subprocess.assert_not_called()
 
 
+@patch("netdoctor.core.ping._FPING", None)
 @patch("netdoctor.core.ping.ping_host")
 def test_ping_sweep(mock_ping_host):
     """Test ping_sweep function."""
@@ -192,6 +203,62 @@ def test_ping_sweep(mock_ping_host):
         assert "error" in result
 
 
+@patch("netdoctor.core.ping._FPING", "/usr/bin/fping")
+@patch("netdoctor.core.ping.subprocess.Popen")
+def test_ping_sweep_fping(mock_popen):
+    """Test ping_sweep batching a network through a single fping call."""
+    mock_popen.return_value.communicate.return_value = (
+        None, b"192.168.1.1 : 0.52\n192.168.1.2 : -\n"
+    )
+    mock_popen.return_value.poll.return_value = 1
+
+    results = list(ping_sweep("192.168.1.0/30", concurrency=2))
+    mock_popen.assert_called_once()
+    assert [r["host"] for r in results] == ["192.168.1.1", "192.168.1.2"]
+    assert results[0]["results"][0]["success"] is True
+    assert results[0]["results"][0]["rtt_ms"] == 0.52
+    assert results[1]["results"][0]["success"] is False
+
+
+@patch("netdoctor.core.ping._FPING", "/usr/bin/fping")
+@patch("netdoctor.core.ping._FPING_CHUNK", 2)
+@patch("netdoctor.core.ping.subprocess.Popen")
+def test_ping_sweep_fping_chunks(mock_popen):
+    """Test that fping sweeps run chunk by chunk and stop when closed."""
+    def fping(cmd, **kwargs):
+        proc = Mock()
+        proc.poll.return_value = 0
+        proc.communicate.side_effect = lambda hosts, timeout: (
+            None, b"".join(host + b" : 1.0\n" for host in hosts.split(b"\n"))
+        )
+        return proc
+    mock_popen.side_effect = fping
+
+    sweep = ping_sweep("192.168.1.0/29", concurrency=2)
+    first = [next(sweep), next(sweep)]
+    assert [r["host"] for r in first] == ["192.168.1.1", "192.168.1.2"]
+    assert mock_popen.call_count == 1
+
+    sweep.close()
+    assert mock_popen.call_count == 1
+
+
+@patch("netdoctor.core.ping._FPING", "/usr/bin/fping")
+@patch("netdoctor.core.ping.subprocess.Popen")
+def test_ping_sweep_fping_timeout_kills(mock_popen):
+    """Test that an fping run that overruns is killed and the chunk retried per host."""
+    proc = mock_popen.return_value
+    proc.communicate.side_effect = subprocess.TimeoutExpired("fping", 5)
+    proc.poll.return_value = None
+
+    with patch("netdoctor.core.ping.ping_host", return_value=[]) as mock_ping_host:
+        results = list(ping_sweep("192.168.1.0/30", concurrency=2))
+
+    proc.kill.assert_called_once()
+    assert mock_ping_host.call_count == 2
+    assert sorted(r["host"] for r in results) == ["192.168.1.1", "192.168.1.2"]
+
+
 def test_ping_sweep_invalid_network():
     """Test ping_sweep with invalid network."""
     results = list(ping_sweep("invalid.network", concurrency=1))
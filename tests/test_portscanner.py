@@ -8,11 +8,30 @@ import subprocess
 from unittest.mock import Mock, patch, MagicMock
 from netdoctor.core.portscanner import (
     scan_ports,
+    scan_ports_iter,
     _scan_single_port,
     _parse_port_range,
     _grab_banner,
+    clear_cache,
     detect_nmap,
 )
+from netdoctor.core.utils import clear_nmap_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_nmap_detection():
+    """Don't let a cached nmap lookup leak between tests."""
+    clear_nmap_cache()
+    yield
+    clear_nmap_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_resolve_cache():
+    """Start every test without cached hostname resolutions."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 def test_parse_port_range_single_int():
@@ -71,6 +90,25 @@ def test_scan_single_port_open(mock_create_connection):
     mock_sock.close.assert_called_once()
 
 
+@patch("socket.create_connection")
+@patch("socket.getaddrinfo")
+def test_scan_single_port_falls_back_to_next_address(mock_getaddrinfo, mock_create_connection):
+    """Test that an unreachable first address falls back to the next one."""
+    mock_getaddrinfo.return_value = [
+        (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 0, 0, 0)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 0)),
+    ]
+    mock_create_connection.side_effect = [OSError("Network is unreachable"), MagicMock()]
+
+    result = _scan_single_port("dualstack.test", 80, timeout=1.0)
+
+    assert result["state"] == "open"
+    assert [c.args[0] for c in mock_create_connection.call_args_list] == [
+        ("2001:db8::1", 80),
+        ("192.0.2.1", 80),
+    ]
+
+
 @patch("socket.create_connection")
 def test_scan_single_port_open_with_banner(mock_create_connection):
     """Test scanning an open port with banner grabbing."""
@@ -251,6 +289,50 @@ def test_scan_ports_exception_handling(mock_scan):
         assert "error" in result
 
 
+def test_scan_ports_iter_nonblocking():
+    """Test the non-blocking scan against a real listener on localhost."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    open_port = listener.getsockname()[1]
+
+    # Grab a free port and release it, so nothing is listening there
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    closed_port = probe.getsockname()[1]
+    probe.close()
+
+    try:
+        results = list(scan_ports_iter(
+            "127.0.0.1", [open_port, closed_port], timeout=1.0, nonblocking=True
+        ))
+    finally:
+        listener.close()
+
+    by_port = {r["port"]: r for r in results}
+    assert by_port[open_port]["state"] == "open"
+    assert by_port[open_port]["error"] is None
+    assert by_port[closed_port]["state"] == "closed"
+    assert by_port[closed_port]["error"] == "Connection refused"
+
+
+def test_scan_ports_iter_nonblocking_invalid_port():
+    """An out-of-range port gets an error result without aborting the scan."""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    closed_port = probe.getsockname()[1]
+    probe.close()
+
+    results = list(scan_ports_iter(
+        "127.0.0.1", [70000, closed_port], timeout=1.0, nonblocking=True
+    ))
+
+    by_port = {r["port"]: r for r in results}
+    assert by_port[70000]["state"] == "closed"
+    assert by_port[70000]["error"]
+    assert by_port[closed_port]["error"] == "Connection refused"
+
+
 @patch("shutil.which")
 @patch("subprocess.run")
 def test_detect_nmap_found(mock_subprocess, mock_which):
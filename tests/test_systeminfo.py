@@ -7,7 +7,15 @@ import psutil
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
-from netdoctor.core.systeminfo import get_system_overview
+from netdoctor.core.systeminfo import get_system_overview, clear_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test without cached partition/interface info."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 def test_get_system_overview_structure():
@@ -84,7 +92,7 @@ def test_get_system_overview_mocked(mock_socket, mock_psutil):
     mock_socket.AF_INET6 = real_socket.AF_INET6  # 10
 
     # Mock CPU
-    mock_psutil.cpu_percent.side_effect = [25.5, [10.0, 20.0, 30.0, 40.0]]
+    mock_psutil.cpu_percent.return_value = [10.0, 20.0, 30.0, 40.0]
 
     # Mock memory
     mock_memory = Mock()
@@ -138,7 +146,7 @@ def test_get_system_overview_mocked(mock_socket, mock_psutil):
     result = get_system_overview()
 
     # Verify structure
-    assert result["cpu_percent"] == 25.5
+    assert result["cpu_percent"] == 25.0
     assert result["per_cpu_percent"] == [10.0, 20.0, 30.0, 40.0]
     assert result["memory_total"] == 8589934592
     assert result["memory_used"] == 4294967296
@@ -160,7 +168,7 @@ def test_get_system_overview_mocked(mock_socket, mock_psutil):
 def test_get_system_overview_windows_no_load_avg(mock_psutil):
     """Test that load_avg is None on Windows (no getloadavg)."""
     # Mock CPU
-    mock_psutil.cpu_percent.side_effect = [25.0, [25.0]]
+    mock_psutil.cpu_percent.return_value = [25.0]
 
     # Mock memory
     mock_memory = Mock()
@@ -199,7 +207,7 @@ def test_get_system_overview_windows_no_load_avg(mock_psutil):
 def test_get_system_overview_disk_permission_error(mock_psutil):
     """Test that disk partitions with permission errors are skipped."""
     # Mock CPU
-    mock_psutil.cpu_percent.side_effect = [25.0, [25.0]]
+    mock_psutil.cpu_percent.return_value = [25.0]
 
     # Mock memory
     mock_memory = Mock()
@@ -259,3 +267,55 @@ def test_get_system_overview_disk_permission_error(mock_psutil):
     assert len(result["disk_partitions"]) == 1
     assert result["disk_partitions"][0]["device"] == "/dev/sda1"
 
+
+@patch("netdoctor.core.systeminfo.psutil")
+def test_get_system_overview_caches_static_info(mock_psutil):
+    """Test that partitions and interface info are reused between polls."""
+    mock_psutil.cpu_percent.side_effect = [[25.0], [30.0]]
+    mock_psutil.disk_partitions.return_value = []
+    mock_psutil.net_io_counters.return_value = {}
+    mock_psutil.net_if_addrs.return_value = {}
+    mock_psutil.net_if_stats.return_value = {}
+    mock_psutil.boot_time.return_value = 0
+    mock_psutil.getloadavg.return_value = (1.0, 1.0, 1.0)
+
+    get_system_overview()
+    result = get_system_overview()
+
+    assert result["cpu_percent"] == 30.0
+    assert mock_psutil.disk_partitions.call_count == 1
+    assert mock_psutil.net_if_addrs.call_count == 1
+    assert mock_psutil.net_io_counters.call_count == 2
+
+
+@patch("netdoctor.core.systeminfo._DISK_USAGE_TIMEOUT", 0.05)
+@patch("netdoctor.core.systeminfo.psutil")
+def test_hung_mount_is_not_queried_again(mock_psutil):
+    """A mount whose usage query is still pending is skipped, not re-queried."""
+    import threading
+    from netdoctor.core.systeminfo import _get_disk_partitions
+
+    release = threading.Event()
+    mock_psutil.disk_partitions.return_value = [
+        Mock(device="nfs:/share", mountpoint="/mnt/share", fstype="nfs")
+    ]
+    mock_psutil.disk_usage.side_effect = lambda mountpoint: release.wait()
+
+    try:
+        assert _get_disk_partitions() == []
+        assert _get_disk_partitions() == []
+        assert mock_psutil.disk_usage.call_count == 1
+    finally:
+        release.set()
+
+
+def test_cached_partitions_are_not_shared():
+    """Changing one overview's partitions doesn't change the next overview's."""
+    first = get_system_overview()
+    for partition in first["disk_partitions"]:
+        partition["used"] = -1
+    first["disk_partitions"].append({"device": "bogus"})
+
+    second = get_system_overview()
+    assert all(partition.get("device") != "bogus" for partition in second["disk_partitions"])
+    assert all(partition["used"] != -1 for partition in second["disk_partitions"])
@@ -2,6 +2,13 @@ import pytest
 from unittest.mock import MagicMock, patch
 from netdoctor.core import utils
 
+@pytest.fixture(autouse=True)
+def fresh_nmap_detection():
+    """Don't let a cached nmap lookup leak between tests."""
+    utils.clear_nmap_cache()
+    yield
+    utils.clear_nmap_cache()
+
 def test_check_python_dependency_installed():
     """Test detection of an installed package."""
     # os is definitely installed
@@ -36,6 +43,21 @@ def test_detect_nmap_missing(mock_which):
     assert result["installed"] is False
     assert "not found" in result["error"].lower()
 
+@patch("shutil.which")
+@patch("subprocess.run")
+def test_detect_nmap_caches_only_success(mock_run, mock_which):
+    """Test that a failed detection is retried but a successful one is cached."""
+    mock_which.return_value = None
+    assert utils.detect_nmap()["installed"] is False
+
+    # nmap installed after the first check is picked up
+    mock_which.return_value = "/usr/bin/nmap"
+    mock_run.return_value = MagicMock(returncode=0, stdout="Nmap version 7.94\n")
+    assert utils.detect_nmap()["installed"] is True
+
+    assert utils.detect_nmap()["version"] == "7.94"
+    mock_run.assert_called_once()
+
 def test_get_all_dependencies():
     """Test that all dependencies are checked."""
     with patch("netdoctor.core.utils.check_python_dependency") as mock_check_py, \
@@ -4,24 +4,39 @@ Unit tests for WHOIS module.
 
 import pytest
 import subprocess
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
-from netdoctor.core.whois import query_whois, PYTHON_WHOIS_AVAILABLE
+from netdoctor.core.whois import (
+    query_whois, query_whois_batch, clear_cache, refresh_whois_binary, PYTHON_WHOIS_AVAILABLE
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test without cached lookups or whois binary path."""
+    clear_cache()
+    refresh_whois_binary()
+    yield
+    clear_cache()
+    refresh_whois_binary()
 
 
 @patch("netdoctor.core.whois.whois")
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", True)
 def test_query_whois_python_whois_success(mock_whois):
     """Test WHOIS query using python-whois."""
-    mock_whois_data = Mock()
-    mock_whois_data.text = "Domain Name: example.com\nRegistrar: Example Registrar"
-    mock_whois_data.domain_name = "example.com"
-    mock_whois_data.registrar = "Example Registrar"
-    mock_whois_data.creation_date = "2020-01-01"
-    mock_whois_data.expiration_date = "2025-01-01"
-    mock_whois_data.updated_date = "2023-01-01"
-    mock_whois_data.name_servers = ["ns1.example.com", "ns2.example.com"]
-    mock_whois_data.status = ["clientTransferProhibited"]
+    # Plain attributes, like python-whois results (Mock invents missing ones)
+    mock_whois_data = SimpleNamespace(
+        text="Domain Name: example.com\nRegistrar: Example Registrar",
+        domain_name="example.com",
+        registrar="Example Registrar",
+        creation_date="2020-01-01",
+        expiration_date="2025-01-01",
+        updated_date="2023-01-01",
+        name_servers=["ns1.example.com", "ns2.example.com"],
+        status=["clientTransferProhibited"],
+    )
 
     mock_whois.whois.return_value = mock_whois_data
 
@@ -40,14 +55,15 @@ def test_query_whois_python_whois_success(mock_whois):
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", True)
 def test_query_whois_python_whois_list_fields(mock_whois):
     """Test WHOIS query with list fields."""
-    mock_whois_data = Mock()
-    mock_whois_data.text = "Domain Name: example.com"
-    mock_whois_data.domain_name = ["example.com", "EXAMPLE.COM"]
-    mock_whois_data.creation_date = ["2020-01-01", "2020-01-02"]
-    mock_whois_data.expiration_date = "2025-01-01"
-    mock_whois_data.updated_date = None
-    mock_whois_data.name_servers = None
-    mock_whois_data.status = None
+    mock_whois_data = SimpleNamespace(
+        text="Domain Name: example.com",
+        domain_name=["example.com", "EXAMPLE.COM"],
+        creation_date=["2020-01-01", "2020-01-02"],
+        expiration_date="2025-01-01",
+        updated_date=None,
+        name_servers=None,
+        status=None,
+    )
 
     mock_whois.whois.return_value = mock_whois_data
 
@@ -62,10 +78,8 @@ def test_query_whois_python_whois_list_fields(mock_whois):
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", True)
 def test_query_whois_python_whois_no_text_attr(mock_whois):
     """Test WHOIS query when text attribute is not available."""
-    mock_whois_data = Mock()
-    del mock_whois_data.text  # Remove text attribute
-    mock_whois_data.__str__ = Mock(return_value="Domain: example.com")
-    mock_whois_data.domain_name = "example.com"
+    # No text attribute, so raw falls back to str() of the result
+    mock_whois_data = SimpleNamespace(domain_name="example.com")
 
     mock_whois.whois.return_value = mock_whois_data
 
@@ -86,7 +100,7 @@ def test_query_whois_python_whois_exception(mock_whois):
     with patch("shutil.which", return_value="/usr/bin/whois"):
         with patch("subprocess.run") as mock_subprocess:
             mock_subprocess.return_value = Mock(
-                returncode=0, stdout="Domain: example.com", stderr=""
+                returncode=0, stdout=b"Domain: example.com", stderr=b""
             )
 
             result = query_whois("example.com")
@@ -103,8 +117,8 @@ def test_query_whois_subprocess_success(mock_subprocess, mock_which):
     mock_which.return_value = "/usr/bin/whois"
     mock_subprocess.return_value = Mock(
         returncode=0,
-        stdout="Domain Name: example.com\nRegistrar: Example Registrar",
-        stderr="",
+        stdout=b"Domain Name: example.com\nRegistrar: Example Registrar",
+        stderr=b"",
     )
 
     result = query_whois("example.com")
@@ -114,6 +128,7 @@ def test_query_whois_subprocess_success(mock_subprocess, mock_which):
     assert "example.com" in result["raw"]
     assert result["error"] is None
     mock_subprocess.assert_called_once()
+    assert mock_subprocess.call_args.kwargs["close_fds"] is False
 
 
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
@@ -124,8 +139,8 @@ def test_query_whois_subprocess_nonzero_exit(mock_subprocess, mock_which):
     mock_which.return_value = "/usr/bin/whois"
     mock_subprocess.return_value = Mock(
         returncode=1,
-        stdout="Domain Name: example.com",
-        stderr="",
+        stdout=b"Domain Name: example.com",
+        stderr=b"",
     )
 
     result = query_whois("example.com")
@@ -135,43 +150,112 @@ def test_query_whois_subprocess_nonzero_exit(mock_subprocess, mock_which):
     assert "example.com" in result["raw"]
 
 
+@pytest.mark.parametrize(
+    "which, side_effect, expected",
+    [
+        ("/usr/bin/whois", subprocess.TimeoutExpired("whois", 10.0), "timed out"),
+        ("/usr/bin/whois", Exception("Subprocess error"), "failed"),
+        (None, None, "not found"),
+    ],
+    ids=["timeout", "exception", "no_whois_command"],
+)
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
 @patch("shutil.which")
 @patch("subprocess.run")
-def test_query_whois_subprocess_timeout(mock_subprocess, mock_which):
-    """Test WHOIS query timeout."""
-    mock_which.return_value = "/usr/bin/whois"
-    mock_subprocess.side_effect = subprocess.TimeoutExpired("whois", 10.0)
+def test_query_whois_subprocess_errors(mock_subprocess, mock_which, which, side_effect, expected):
+    """Test that each way the whois command can fail is reported as an error."""
+    mock_which.return_value = which
+    mock_subprocess.side_effect = side_effect
 
     result = query_whois("example.com")
 
     assert result["error"] is not None
-    error_lower = result["error"].lower() if result["error"] else ""
-    assert "timeout" in error_lower or "timed out" in error_lower
+    assert expected in result["error"].lower()
 
 
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
 @patch("shutil.which")
-def test_query_whois_no_whois_command(mock_which):
-    """Test WHOIS query when whois command is not found."""
-    mock_which.return_value = None
+@patch("subprocess.run")
+def test_query_whois_cached(mock_subprocess, mock_which):
+    """Test that a repeat query is served from the cache."""
+    mock_which.return_value = "/usr/bin/whois"
+    mock_subprocess.return_value = Mock(
+        returncode=0, stdout=b"Domain Name: example.com", stderr=b""
+    )
 
-    result = query_whois("example.com")
+    first = query_whois("example.com")
+    first["raw"] = None  # Changing a returned result must not touch the cache
+    second = query_whois("Example.COM")
 
-    assert result["error"] is not None
-    assert "not found" in result["error"].lower() or "not available" in result["error"].lower()
+    assert second["raw"] == "Domain Name: example.com"
+    mock_subprocess.assert_called_once()
+
+
+@patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
+@patch("shutil.which")
+@patch("subprocess.run")
+def test_query_whois_errors_not_cached(mock_subprocess, mock_which):
+    """Test that a failed query is retried rather than cached."""
+    mock_which.return_value = "/usr/bin/whois"
+    mock_subprocess.side_effect = subprocess.TimeoutExpired("whois", 10.0)
+
+    query_whois("example.com")
+    query_whois("example.com")
+
+    assert mock_subprocess.call_count == 2
 
 
 @patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
 @patch("shutil.which")
 @patch("subprocess.run")
-def test_query_whois_subprocess_exception(mock_subprocess, mock_which):
-    """Test WHOIS query when subprocess raises exception."""
+def test_query_whois_batch(mock_subprocess, mock_which):
+    """Test batch WHOIS queries keep input order and look each domain up once."""
     mock_which.return_value = "/usr/bin/whois"
-    mock_subprocess.side_effect = Exception("Subprocess error")
+    mock_subprocess.side_effect = lambda cmd, **kwargs: Mock(
+        returncode=0, stdout=f"Domain Name: {cmd[-1]}".encode(), stderr=b""
+    )
+
+    results = query_whois_batch(["example.com", "example.org", "EXAMPLE.com"])
+
+    assert [r["raw"] for r in results] == [
+        "Domain Name: example.com",
+        "Domain Name: example.org",
+        "Domain Name: example.com",
+    ]
+    assert results[0] is not results[2]
+    assert mock_subprocess.call_count == 2
+
+
+@patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
+@patch("shutil.which")
+@patch("subprocess.run")
+def test_query_whois_subprocess_invalid_utf8(mock_subprocess, mock_which):
+    """Test that undecodable WHOIS output is replaced rather than failing."""
+    mock_which.return_value = "/usr/bin/whois"
+    mock_subprocess.return_value = Mock(
+        returncode=0, stdout=b"Registrant: Caf\xe9", stderr=b""
+    )
 
     result = query_whois("example.com")
 
-    assert result["error"] is not None
-    assert "failed" in result["error"].lower()
+    assert result["error"] is None
+    assert result["raw"] == "Registrant: Caf�"
+
+
+@patch("netdoctor.core.whois.PYTHON_WHOIS_AVAILABLE", False)
+@patch("shutil.which")
+@patch("subprocess.run")
+def test_query_whois_uncached(mock_subprocess, mock_which):
+    """Test that cached=False skips the cache but refreshes it."""
+    mock_which.return_value = "/usr/bin/whois"
+    mock_subprocess.side_effect = [
+        Mock(returncode=0, stdout=b"Registrar: Old Registrar", stderr=b""),
+        Mock(returncode=0, stdout=b"Registrar: New Registrar", stderr=b""),
+    ]
+
+    query_whois("example.com")
+    fresh = query_whois("example.com", cached=False)
 
+    assert fresh["raw"] == "Registrar: New Registrar"
+    assert query_whois("example.com") == fresh
+    assert mock_subprocess.call_count == 2
@@ -2,16 +2,16 @@
 Unit tests for TaskWorker and WorkerSignals.
 """
 
+import os
 import time
-import threading
-from PySide6.QtCore import QCoreApplication, QThreadPool, QTimer
+from PySide6.QtCore import QCoreApplication, QEventLoop, QThreadPool, QTimer
 from PySide6.QtTest import QSignalSpy
 import pytest
 
-from netdoctor.workers.task_worker import TaskWorker, WorkerSignals
+from netdoctor.workers.task_worker import TaskWorker, WorkerSignals, RowBatcher
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     """Create QCoreApplication for testing Qt signals."""
     if not QCoreApplication.instance():
@@ -21,6 +21,29 @@ def app():
     return app
 
 
+@pytest.fixture(scope="session")
+def thread_pool(app):
+    """Thread pool for the worker tests, separate from the global instance."""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(os.cpu_count() or 1)
+    yield pool
+    pool.waitForDone()
+
+
+def run_until_finished(worker, timeout=5.0):
+    """Start a worker and run the event loop until it emits finished."""
+    loop = QEventLoop()
+    # finished is always the worker's last signal, and being queued it is
+    # delivered after every signal emitted before it
+    worker.signals.finished.connect(loop.quit)
+    watchdog = QTimer(loop)
+    watchdog.setSingleShot(True)
+    watchdog.timeout.connect(loop.quit)
+    watchdog.start(int(timeout * 1000))
+    worker.start()
+    loop.exec()
+
+
 def test_worker_signals_creation():
     """Test that WorkerSignals can be instantiated."""
     signals = WorkerSignals()
@@ -32,7 +55,7 @@ def test_worker_signals_creation():
     assert hasattr(signals, "finished")
 
 
-def test_worker_basic_execution(app):
+def test_worker_basic_execution(thread_pool):
     """Test that a simple task executes and emits finished signal."""
     result_container = {"value": None}
 
@@ -42,7 +65,7 @@ def test_worker_basic_execution(app):
         return {"status": "success", "value": 42}
 
     signals = WorkerSignals()
-    worker = TaskWorker(simple_task, signals)
+    worker = TaskWorker(simple_task, signals, pool=thread_pool)
 
     # Spy on signals
     finished_spy = QSignalSpy(signals.finished)
@@ -53,17 +76,8 @@ def test_worker_basic_execution(app):
 
     signals.finished.connect(on_finished)
 
-    # Start worker
-    QThreadPool.globalInstance().start(worker)
-
-    # Wait for thread pool to finish and process events
-    thread_pool = QThreadPool.globalInstance()
-    timeout = 5.0
-    start_time = time.time()
-    while finished_spy.count() == 0 and (time.time() - start_time) < timeout:
-        thread_pool.waitForDone(100)  # Wait up to 100ms
-        app.processEvents()
-        time.sleep(0.01)
+    # Start worker and wait for it to finish
+    run_until_finished(worker)
 
     # Verify signals were emitted
     assert finished_spy.count() > 0
@@ -71,7 +85,7 @@ def test_worker_basic_execution(app):
     assert log_spy.count() >= 2  # "Task started" and "Task completed"
 
 
-def test_worker_progress_emission(app):
+def test_worker_progress_emission(thread_pool):
     """Test that progress signals are emitted correctly."""
     progress_values = []
 
@@ -85,7 +99,7 @@ def test_worker_progress_emission(app):
         return {"progress": 100}
 
     signals = WorkerSignals()
-    worker = TaskWorker(progress_task, signals)
+    worker = TaskWorker(progress_task, signals, pool=thread_pool)
 
     def on_progress(value):
         progress_values.append(value)
@@ -93,24 +107,16 @@ def test_worker_progress_emission(app):
     signals.progress.connect(on_progress)
     finished_spy = QSignalSpy(signals.finished)
 
-    thread_pool = QThreadPool.globalInstance()
-    thread_pool.start(worker)
-
-    # Wait for completion
-    timeout = 5.0
-    start_time = time.time()
-    while finished_spy.count() == 0 and (time.time() - start_time) < timeout:
-        thread_pool.waitForDone(100)  # Wait up to 100ms
-        app.processEvents()
-        time.sleep(0.01)
+    run_until_finished(worker)
 
     # Verify progress was emitted
+    assert finished_spy.count() == 1
     assert len(progress_values) >= 4  # At least 0, 25, 50, 75, 100
     assert 0 in progress_values
     assert 100 in progress_values
 
 
-def test_worker_row_emission(app):
+def test_worker_row_emission(thread_pool):
     """Test that row signals are emitted correctly."""
     rows_received = []
 
@@ -124,7 +130,7 @@ def test_worker_row_emission(app):
         return {"rows": 5}
 
     signals = WorkerSignals()
-    worker = TaskWorker(row_task, signals)
+    worker = TaskWorker(row_task, signals, pool=thread_pool)
 
     def on_row(row):
         rows_received.append(row)
@@ -132,24 +138,16 @@ def test_worker_row_emission(app):
     signals.row.connect(on_row)
     finished_spy = QSignalSpy(signals.finished)
 
-    thread_pool = QThreadPool.globalInstance()
-    thread_pool.start(worker)
-
-    # Wait for completion
-    timeout = 5.0
-    start_time = time.time()
-    while finished_spy.count() == 0 and (time.time() - start_time) < timeout:
-        thread_pool.waitForDone(100)  # Wait up to 100ms
-        app.processEvents()
-        time.sleep(0.01)
+    run_until_finished(worker)
 
     # Verify rows were emitted
+    assert finished_spy.count() == 1
     assert len(rows_received) == 5
     assert rows_received[0] == {"id": 0, "data": "item_0"}
     assert rows_received[4] == {"id": 4, "data": "item_4"}
 
 
-def test_worker_cancellation(app):
+def test_worker_cancellation(thread_pool):
     """Test that cancellation works correctly."""
     cancelled = {"value": False}
 
@@ -165,27 +163,14 @@ def test_worker_cancellation(app):
         return {"completed": True}
 
     signals = WorkerSignals()
-    worker = TaskWorker(long_running_task, signals)
+    worker = TaskWorker(long_running_task, signals, pool=thread_pool)
 
     finished_spy = QSignalSpy(signals.finished)
     log_spy = QSignalSpy(signals.log)
 
-    thread_pool = QThreadPool.globalInstance()
-    thread_pool.start(worker)
-
-    # Wait a bit for task to start running, then cancel
-    time.sleep(0.15)
-    worker.cancel()
-    # Give a moment for cancellation to propagate
-    time.sleep(0.05)
-
-    # Wait for cancellation to complete
-    timeout = 5.0
-    start_time = time.time()
-    while finished_spy.count() == 0 and (time.time() - start_time) < timeout:
-        thread_pool.waitForDone(100)  # Wait up to 100ms
-        app.processEvents()
-        time.sleep(0.01)
+    # Cancel as soon as the first progress update shows the task is running
+    signals.progress.connect(lambda value: worker.cancel())
+    run_until_finished(worker)
 
     # Verify cancellation
     assert worker.is_cancelled()
@@ -195,7 +180,7 @@ def test_worker_cancellation(app):
     assert log_spy.count() > 0
 
 
-def test_worker_error_handling(app):
+def test_worker_error_handling(thread_pool):
     """Test that exceptions are caught and error signals are emitted."""
     error_received = {"value": None}
 
@@ -204,7 +189,7 @@ def test_worker_error_handling(app):
         raise ValueError("Test error message")
 
     signals = WorkerSignals()
-    worker = TaskWorker(failing_task, signals)
+    worker = TaskWorker(failing_task, signals, pool=thread_pool)
 
     def on_error(error_msg):
         error_received["value"] = error_msg
@@ -213,25 +198,10 @@ def test_worker_error_handling(app):
     finished_spy = QSignalSpy(signals.finished)
     error_spy = QSignalSpy(signals.error)
 
-    thread_pool = QThreadPool.globalInstance()
-    thread_pool.start(worker)
-
-    # Wait for error
-    timeout = 5.0
-    start_time = time.time()
-    while finished_spy.count() == 0 and (time.time() - start_time) < timeout:
-        thread_pool.waitForDone(100)  # Wait up to 100ms
-        app.processEvents()
-        # Process more events to ensure signals are delivered
-        for _ in range(10):
-            app.processEvents()
-        time.sleep(0.01)
+    run_until_finished(worker)
 
     # Verify error was handled
     assert error_spy.count() > 0
-    # Process events one more time to ensure callback is called
-    for _ in range(10):
-        app.processEvents()
     assert error_received["value"] is not None
     assert "Test error message" in error_received["value"]
     assert finished_spy.count() > 0
@@ -258,3 +228,17 @@ def test_worker_cancel_before_start():
 
     # The task should see the cancellation flag
     assert worker2.is_cancelled()
+
+
+def test_row_batcher(app):
+    """Test that RowBatcher emits rows in batches and flushes the remainder."""
+    signals = WorkerSignals()
+    batches = []
+    signals.rows.connect(batches.append)
+
+    with RowBatcher(signals.rows, flush_ms=60000, max_rows=4) as batcher:
+        for i in range(10):
+            batcher.add({"id": i})
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [row["id"] for batch in batches for row in batch] == list(range(10))